@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import ClassVar
 
+from homeassistant.util import dt as dt_util
+
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HeatingRateObservation:
     """Single heating rate observation."""
 
@@ -21,7 +25,7 @@ class HeatingRateObservation:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class RecoverySession:
     """Tracks an active recovery session spanning multiple cycles."""
 
@@ -31,8 +35,10 @@ class RecoverySession:
     outdoor_temp: float  # snapshot at session start
     cycles_in_session: int = 0
     cycle_duties: list[float] = field(default_factory=list)
+    duty_sum: float = 0.0  # running sum of cycle_duties
     last_progress_cycle: int = 0
     last_temp: float | None = None  # for progress detection
+    stalled: bool = False  # no progress for STALL_CYCLES cycles, updated per cycle
 
 
 # Bin boundaries
@@ -41,6 +47,13 @@ DELTA_BIN_NAMES = ["delta_0_2", "delta_2_4", "delta_4_6", "delta_6_plus"]
 OUTDOOR_BINS = [(-float("inf"), 5), (5, 15), (15, float("inf"))]
 OUTDOOR_BIN_NAMES = ["cold", "mild", "moderate"]
 
+# Upper bin edges and flat row-major (delta, outdoor) key table for bisect lookups
+_DELTA_EDGES = tuple(high for _, high in DELTA_BINS[:-1])
+_OUTDOOR_EDGES = tuple(high for _, high in OUTDOOR_BINS[:-1])
+_BIN_KEYS = tuple(
+    f"{delta_name}_{outdoor_name}" for delta_name in DELTA_BIN_NAMES for outdoor_name in OUTDOOR_BIN_NAMES
+)
+
 # Minimum session duration by heating type (minutes)
 MIN_SESSION_DURATION: dict[str, int] = {
     "floor_hydronic": 60,
@@ -80,35 +93,28 @@ class HeatingRateLearner:
             heating_type: HeatingType enum value (e.g., "floor_hydronic")
         """
         self._heating_type = heating_type
-        self._bins: dict[str, list[HeatingRateObservation]] = {}
+        # Heating type is fixed per learner, so resolve its per-type constants once
+        self._min_session_duration = MIN_SESSION_DURATION.get(heating_type, 30)
+        self._fallback_rate = self.FALLBACK_RATES.get(heating_type, 0.3)
+        self._bins: dict[str, deque[HeatingRateObservation]] = {}
+        # Running rate sum and count per (bin_key, source), kept in step with the bins
+        self._rate_sums: dict[tuple[str, str], float] = {}
+        self._rate_counts: dict[tuple[str, str], int] = {}
         self._active_session: RecoverySession | None = None
         self._stall_counter: int = 0
         self._last_stall_outdoor: float | None = None
         self._last_stall_setpoint: float | None = None
+        self._last_session_avg_duty: float | None = None
 
-        # Initialize all 12 bins
-        for delta_name in DELTA_BIN_NAMES:
-            for outdoor_name in OUTDOOR_BIN_NAMES:
-                key = f"{delta_name}_{outdoor_name}"
-                self._bins[key] = []
+        # Initialize all 12 bins as ring buffers that drop the oldest observation when full
+        for key in _BIN_KEYS:
+            self._bins[key] = deque(maxlen=self.MAX_OBSERVATIONS_PER_BIN)
 
     def _get_bin_key(self, delta: float, outdoor_temp: float) -> str:
         """Get bin key for given delta and outdoor temp."""
-        # Find delta bin
-        delta_name = DELTA_BIN_NAMES[-1]  # default to largest
-        for i, (low, high) in enumerate(DELTA_BINS):
-            if low <= delta < high:
-                delta_name = DELTA_BIN_NAMES[i]
-                break
-
-        # Find outdoor bin
-        outdoor_name = OUTDOOR_BIN_NAMES[-1]  # default to warmest
-        for i, (low, high) in enumerate(OUTDOOR_BINS):
-            if low <= outdoor_temp < high:
-                outdoor_name = OUTDOOR_BIN_NAMES[i]
-                break
-
-        return f"{delta_name}_{outdoor_name}"
+        # Negative delta falls outside every delta bin and defaults to the largest
+        delta_idx = bisect_right(_DELTA_EDGES, delta) if delta >= 0 else len(_DELTA_EDGES)
+        return _BIN_KEYS[delta_idx * len(OUTDOOR_BIN_NAMES) + bisect_right(_OUTDOOR_EDGES, outdoor_temp)]
 
     def add_observation(
         self,
@@ -131,11 +137,6 @@ class HeatingRateLearner:
             outdoor_temp: Outdoor temperature at session start
             timestamp: Observation timestamp (defaults to now)
         """
-        from homeassistant.util import dt as dt_util
-
-        if timestamp is None:
-            timestamp = dt_util.utcnow()
-
         # Filter out invalid/poisoned rates
         if rate < self.MIN_OBSERVATION_RATE:
             _LOGGER.debug(
@@ -145,6 +146,11 @@ class HeatingRateLearner:
             )
             return
 
+        bin_key = self._get_bin_key(delta, outdoor_temp)
+
+        if timestamp is None:
+            timestamp = dt_util.utcnow()
+
         obs = HeatingRateObservation(
             rate=rate,
             duration_min=duration_min,
@@ -153,12 +159,29 @@ class HeatingRateLearner:
             timestamp=timestamp,
         )
 
-        bin_key = self._get_bin_key(delta, outdoor_temp)
-        self._bins[bin_key].append(obs)
+        self._append_observation(bin_key, obs)
+
+    def _append_observation(self, bin_key: str, obs: HeatingRateObservation) -> None:
+        """Append an observation to a bin and update the running per-source rate sums."""
+        observations = self._bins[bin_key]
 
-        # Cap at max observations, keep newest
-        if len(self._bins[bin_key]) > self.MAX_OBSERVATIONS_PER_BIN:
-            self._bins[bin_key] = self._bins[bin_key][-self.MAX_OBSERVATIONS_PER_BIN :]
+        # Bin is capped at MAX_OBSERVATIONS_PER_BIN, so appending evicts the oldest
+        if len(observations) == observations.maxlen:
+            evicted = observations[0]
+            self._rate_sums[(bin_key, evicted.source)] -= evicted.rate
+            self._rate_counts[(bin_key, evicted.source)] -= 1
+
+        observations.append(obs)
+        stat_key = (bin_key, obs.source)
+        self._rate_sums[stat_key] = self._rate_sums.get(stat_key, 0.0) + obs.rate
+        self._rate_counts[stat_key] = self._rate_counts.get(stat_key, 0) + 1
+
+    def _get_mean_rate(self, bin_key: str, source: str) -> tuple[float | None, int]:
+        """Get (mean rate, observation count) for one source in a bin; mean is None without observations."""
+        count = self._rate_counts.get((bin_key, source), 0)
+        if count == 0:
+            return (None, 0)
+        return (self._rate_sums[(bin_key, source)] / count, count)
 
     def get_observation_count(self) -> int:
         """Get total observation count across all bins."""
@@ -176,23 +199,19 @@ class HeatingRateLearner:
             source: "learned_session", "learned_cycle", or "fallback"
         """
         bin_key = self._get_bin_key(delta, outdoor_temp)
-        observations = self._bins[bin_key]
 
         # Try session observations first (≥3 required)
-        session_obs = [o for o in observations if o.source == "session"]
-        if len(session_obs) >= self.MIN_OBSERVATIONS_FOR_RATE:
-            avg_rate = sum(o.rate for o in session_obs) / len(session_obs)
-            return (avg_rate, "learned_session")
+        session_rate, session_count = self._get_mean_rate(bin_key, "session")
+        if session_count >= self.MIN_OBSERVATIONS_FOR_RATE:
+            return (session_rate, "learned_session")
 
         # Try cycle observations (≥3 required)
-        cycle_obs = [o for o in observations if o.source == "cycle"]
-        if len(cycle_obs) >= self.MIN_OBSERVATIONS_FOR_RATE:
-            avg_rate = sum(o.rate for o in cycle_obs) / len(cycle_obs)
-            return (avg_rate, "learned_cycle")
+        cycle_rate, cycle_count = self._get_mean_rate(bin_key, "cycle")
+        if cycle_count >= self.MIN_OBSERVATIONS_FOR_RATE:
+            return (cycle_rate, "learned_cycle")
 
         # Fallback to heating type default
-        fallback = self.FALLBACK_RATES.get(self._heating_type, 0.3)
-        return (fallback, "fallback")
+        return (self._fallback_rate, "fallback")
 
     def start_session(
         self,
@@ -209,8 +228,6 @@ class HeatingRateLearner:
             outdoor_temp: Current outdoor temperature
             timestamp: Session start time (defaults to now)
         """
-        from homeassistant.util import dt as dt_util
-
         if timestamp is None:
             timestamp = dt_util.utcnow()
 
@@ -238,31 +255,28 @@ class HeatingRateLearner:
         Returns:
             HeatingRateObservation if session was valid and banked, None if discarded
         """
-        from homeassistant.util import dt as dt_util
-
         if self._active_session is None:
             return None
 
-        if timestamp is None:
-            timestamp = dt_util.utcnow()
-
         session = self._active_session
         self._active_session = None
 
         # Store avg duty before clearing session
         if session.cycle_duties:
-            self._last_session_avg_duty = sum(session.cycle_duties) / len(session.cycle_duties)
+            self._last_session_avg_duty = session.duty_sum / len(session.cycle_duties)
 
         # Discard if override interrupted
         if reason == "override":
             return None
 
+        if timestamp is None:
+            timestamp = dt_util.utcnow()
+
         # Calculate duration
         duration_min = (timestamp - session.start_time).total_seconds() / 60.0
 
         # Discard if too short
-        min_duration = MIN_SESSION_DURATION.get(self._heating_type, 30)
-        if duration_min < min_duration:
+        if duration_min < self._min_session_duration:
             return None
 
         # Calculate rate
@@ -291,19 +305,17 @@ class HeatingRateLearner:
         else:
             self._record_success()
 
-        # Bank observation
-        delta = session.target_setpoint - session.start_temp
-        self.add_observation(
+        # Bank observation (rate already validated above, so skip add_observation's checks)
+        obs = HeatingRateObservation(
             rate=rate,
             duration_min=duration_min,
             source="session",
             stalled=stalled,
-            delta=delta,
-            outdoor_temp=session.outdoor_temp,
             timestamp=timestamp,
         )
-
-        return self._bins[self._get_bin_key(delta, session.outdoor_temp)][-1]
+        delta = session.target_setpoint - session.start_temp
+        self._append_observation(self._get_bin_key(delta, session.outdoor_temp), obs)
+        return obs
 
     def update_session(self, temp: float, duty: float) -> None:
         """Update session with cycle completion data."""
@@ -313,6 +325,7 @@ class HeatingRateLearner:
         session = self._active_session
         session.cycles_in_session += 1
         session.cycle_duties.append(duty)
+        session.duty_sum += duty
 
         # Check for progress
         if session.last_temp is not None:
@@ -321,21 +334,17 @@ class HeatingRateLearner:
                 session.last_progress_cycle = session.cycles_in_session
 
         session.last_temp = temp
+        session.stalled = session.cycles_in_session - session.last_progress_cycle >= self.STALL_CYCLES
 
     def is_stalled(self) -> bool:
         """Check if current session is stalled (no progress for 3 cycles)."""
-        if self._active_session is None:
-            return False
-
-        session = self._active_session
-        cycles_since_progress = session.cycles_in_session - session.last_progress_cycle
-        return cycles_since_progress >= self.STALL_CYCLES
+        return self._active_session is not None and self._active_session.stalled
 
     def get_avg_session_duty(self) -> float | None:
         """Get average duty for current session."""
         if self._active_session is None or not self._active_session.cycle_duties:
             return None
-        return sum(self._active_session.cycle_duties) / len(self._active_session.cycle_duties)
+        return self._active_session.duty_sum / len(self._active_session.cycle_duties)
 
     def _check_reset_conditions(self, outdoor_temp: float, setpoint: float) -> None:
         """Check if conditions changed enough to reset stall counter."""
@@ -365,7 +374,7 @@ class HeatingRateLearner:
         if self._stall_counter < self.STALLS_FOR_BOOST:
             return False
 
-        if not hasattr(self, "_last_session_avg_duty"):
+        if self._last_session_avg_duty is None:
             return False
 
         return self._last_session_avg_duty < self.DUTY_CAPACITY_THRESHOLD
@@ -385,15 +394,12 @@ class HeatingRateLearner:
         Returns:
             Ratio (0.0-1.0+) if sufficient data, None otherwise
         """
-        bin_key = self._get_bin_key(delta, outdoor_temp)
-        observations = self._bins[bin_key]
+        expected_rate, session_count = self._get_mean_rate(self._get_bin_key(delta, outdoor_temp), "session")
 
         # Need minimum observations for reliable comparison
-        session_obs = [o for o in observations if o.source == "session"]
-        if len(session_obs) < self.MIN_OBSERVATIONS_FOR_COMPARISON:
+        if session_count < self.MIN_OBSERVATIONS_FOR_COMPARISON:
             return None
 
-        expected_rate = sum(o.rate for o in session_obs) / len(session_obs)
         if expected_rate <= 0:
             return None
 
@@ -442,19 +448,20 @@ class HeatingRateLearner:
         """
         from .physics import calculate_expected_heating_rate
 
-        # Get all non-stalled session observations
-        all_observations = []
-        for observations in self._bins.values():
-            for obs in observations:
-                if obs.source == "session" and not obs.stalled:
-                    all_observations.append(obs)
+        # Get rates of all non-stalled session observations in a single pass
+        rates = [
+            obs.rate
+            for observations in self._bins.values()
+            for obs in observations
+            if obs.source == "session" and not obs.stalled
+        ]
 
         # Need minimum observations for reliable comparison
-        if len(all_observations) < self.MIN_OBSERVATIONS_FOR_RATE:
+        if len(rates) < self.MIN_OBSERVATIONS_FOR_RATE:
             return None
 
         # Calculate average learned rate
-        learned_rate = sum(o.rate for o in all_observations) / len(all_observations)
+        learned_rate = sum(rates) / len(rates)
         if learned_rate <= 0:
             return None
 
@@ -490,7 +497,7 @@ class HeatingRateLearner:
             "ratio": round(ratio, 2),
             "is_underperforming": is_underperforming,
             "suggested_ki_boost": suggested_ki_boost,
-            "observation_count": len(all_observations),
+            "observation_count": len(rates),
         }
 
     def to_dict(self) -> dict:
@@ -519,8 +526,6 @@ class HeatingRateLearner:
     @classmethod
     def from_dict(cls, data: dict) -> HeatingRateLearner:
         """Restore learner from serialized state."""
-        from datetime import datetime
-
         heating_type = data.get("heating_type", "radiator")
         learner = cls(heating_type)
 
@@ -528,16 +533,21 @@ class HeatingRateLearner:
         bins_data = data.get("bins", {})
         for key, obs_list in bins_data.items():
             if key in learner._bins:
-                learner._bins[key] = [
-                    HeatingRateObservation(
-                        rate=obs["rate"],
-                        duration_min=obs["duration_min"],
-                        source=obs["source"],
-                        stalled=obs["stalled"],
-                        timestamp=datetime.fromisoformat(obs["timestamp"]),
+                for obs in obs_list:
+                    source = obs["source"]
+                    if source not in ("session", "cycle"):
+                        _LOGGER.warning("Skipping restored heating rate observation with unknown source %r", source)
+                        continue
+                    learner._append_observation(
+                        key,
+                        HeatingRateObservation(
+                            rate=obs["rate"],
+                            duration_min=obs["duration_min"],
+                            source=source,
+                            stalled=obs["stalled"],
+                            timestamp=datetime.fromisoformat(obs["timestamp"]),
+                        ),
                     )
-                    for obs in obs_list
-                ]
 
         # Restore stall tracking
         learner._stall_counter = data.get("stall_counter", 0)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from collections import deque
+from collections.abc import Iterable
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,17 +29,29 @@ class ComfortDegradationDetector:
         self._zone_id = zone_id
         self._zone_name = zone_name
         self._samples: deque[float] = deque(maxlen=max_samples)
+        self._sum = 0.0  # Running sum of _samples for O(1) rolling average
 
     def record_score(self, score: float) -> None:
         """Record a comfort score sample."""
-        self._samples.append(score)
+        samples = self._samples
+        if len(samples) == samples.maxlen:
+            self._sum -= samples[0]  # Evicted by the append below
+        samples.append(score)
+        self._sum += score
+
+    def record_scores(self, scores: Iterable[float]) -> None:
+        """Record several comfort score samples in one call."""
+        samples = self._samples
+        samples.extend(scores)
+        self._sum = sum(samples)
 
     @property
     def rolling_average(self) -> float | None:
         """Get rolling average, or None if insufficient data."""
-        if len(self._samples) < MIN_SAMPLES_FOR_DETECTION:
+        count = len(self._samples)
+        if count < MIN_SAMPLES_FOR_DETECTION:
             return None
-        return sum(self._samples) / len(self._samples)
+        return self._sum / count
 
     def check_degradation(self, current_score: float) -> bool:
         """Check if current score indicates degradation.
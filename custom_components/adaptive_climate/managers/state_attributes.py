@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -9,6 +10,14 @@ if TYPE_CHECKING:
 
 from homeassistant.util import dt as dt_util
 
+from ..const import (
+    CONFIDENCE_TIER_1,
+    CONFIDENCE_TIER_2,
+    CONFIDENCE_TIER_3,
+    HEATING_TYPE_CONFIDENCE_SCALE,
+    MIN_CYCLES_FOR_LEARNING,
+    HeatingType,
+)
 
 # Learning/adaptation state attribute constants
 ATTR_LEARNING_STATUS = "learning_status"
@@ -18,6 +27,31 @@ ATTR_CONVERGENCE_CONFIDENCE = "convergence_confidence_pct"
 # Optimized status threshold - 95% confidence
 OPTIMIZED_CONFIDENCE_THRESHOLD = 0.95
 
+# (thermostat attribute, state attribute key) for preset temperatures
+_PRESET_TEMP_ATTRS = (
+    ("_away_temp", "away_temp"),
+    ("_eco_temp", "eco_temp"),
+    ("_boost_temp", "boost_temp"),
+    ("_comfort_temp", "comfort_temp"),
+    ("_home_temp", "home_temp"),
+    ("_sleep_temp", "sleep_temp"),
+    ("_activity_temp", "activity_temp"),
+)
+
+# Per heating type (tier 1, tier 2, tier 3) confidence thresholds as 0.0-1.0.
+# Tiers 1/2 are scaled by heating type and capped at 95%; tier 3 is NOT scaled.
+_SCALED_THRESHOLDS: dict[str, tuple[float, float, float]] = {
+    heating_type: (
+        min(CONFIDENCE_TIER_1 * scale / 100.0, 0.95),
+        min(CONFIDENCE_TIER_2 * scale / 100.0, 0.95),
+        CONFIDENCE_TIER_3 / 100.0,
+    )
+    for heating_type, scale in HEATING_TYPE_CONFIDENCE_SCALE.items()
+}
+
+# Learning status by number of tier thresholds reached (index into _SCALED_THRESHOLDS)
+_TIER_STATUSES = ("collecting", "stable", "tuned", "optimized")
+
 
 def build_state_attributes(thermostat: SmartThermostat) -> dict[str, Any]:
     """Build the extra state attributes dictionary for a thermostat entity.
@@ -75,20 +109,10 @@ def build_state_attributes(thermostat: SmartThermostat) -> dict[str, Any]:
             ]
 
     # Add preset temperatures if they exist
-    preset_attrs = [
-        "_away_temp",
-        "_eco_temp",
-        "_boost_temp",
-        "_comfort_temp",
-        "_home_temp",
-        "_sleep_temp",
-        "_activity_temp",
-    ]
-    for attr_name in preset_attrs:
-        if hasattr(thermostat, attr_name):
-            value = getattr(thermostat, attr_name, None)
-            if value is not None:
-                attrs[attr_name[1:]] = value  # Remove leading underscore
+    for attr_name, attr_key in _PRESET_TEMP_ATTRS:
+        value = getattr(thermostat, attr_name, None)
+        if value is not None:
+            attrs[attr_key] = value
 
     # Consolidated status attribute (using new structure from StatusManager)
     attrs["status"] = _build_status_attribute(thermostat)
@@ -133,6 +157,16 @@ def _compute_duty_accumulator_pct(thermostat: SmartThermostat) -> float:
     return round(100.0 * accumulator / min_on, 1)
 
 
+def _confidence_tier(heating_type: str, convergence_confidence: float) -> int:
+    """Return how many heating-type scaled confidence tiers have been reached (0-3).
+
+    The stateful tier gates are applied by the caller.
+    """
+    # Heating-type-specific thresholds, defaulting to CONVECTOR if not recognized
+    thresholds = _SCALED_THRESHOLDS.get(heating_type, _SCALED_THRESHOLDS[HeatingType.CONVECTOR])
+    return bisect_right(thresholds, convergence_confidence)
+
+
 def _compute_learning_status(
     cycle_count: int,
     convergence_confidence: float,
@@ -154,56 +188,26 @@ def _compute_learning_status(
     Returns:
         Learning status string: "idle" | "collecting" | "stable" | "tuned" | "optimized"
     """
-    from ..const import (
-        MIN_CYCLES_FOR_LEARNING,
-        CONFIDENCE_TIER_1,
-        CONFIDENCE_TIER_2,
-        CONFIDENCE_TIER_3,
-        HEATING_TYPE_CONFIDENCE_SCALE,
-        HeatingType,
-    )
-
     # Return idle first if any pause condition is active
     if is_paused:
         return "idle"
 
-    # Get heating-type-specific confidence scaling factor
-    # Default to CONVECTOR (1.0) if heating_type not recognized
-    scale = HEATING_TYPE_CONFIDENCE_SCALE.get(
-        heating_type, HEATING_TYPE_CONFIDENCE_SCALE.get(HeatingType.CONVECTOR, 1.0)
-    )
-
-    # Calculate scaled thresholds (tier 3 is NOT scaled - always 95%)
-    scaled_tier_1 = min(CONFIDENCE_TIER_1 * scale / 100.0, 0.95)  # Cap at 95%
-    scaled_tier_2 = min(CONFIDENCE_TIER_2 * scale / 100.0, 0.95)  # Cap at 95%
-    tier_3 = CONFIDENCE_TIER_3 / 100.0  # Always 95%
-
-    # Check tier gates (recovery cycle requirements) if tracker provided
-    can_reach_tier_1 = True
-    can_reach_tier_2 = True
-    if contribution_tracker is not None:
-        can_reach_tier_1 = contribution_tracker.can_reach_tier(1, mode)
-        can_reach_tier_2 = contribution_tracker.can_reach_tier(2, mode)
-
-    # Collecting: not enough cycles OR confidence below tier 1 OR not enough recovery cycles
-    # Stable: confidence >= tier 1 AND < tier 2 AND enough recovery cycles for tier 1
-    # Tuned: confidence >= tier 2 AND < tier 3 AND enough recovery cycles for tier 2
-    # Optimized: confidence >= tier 3
-    if cycle_count < MIN_CYCLES_FOR_LEARNING or convergence_confidence < scaled_tier_1:
-        return "collecting"
-    elif not can_reach_tier_1:
-        # Confidence threshold met but not enough recovery cycles for tier 1
+    if cycle_count < MIN_CYCLES_FOR_LEARNING:
         return "collecting"
-    elif convergence_confidence >= tier_3:
-        return "optimized"
-    elif convergence_confidence >= scaled_tier_2:
-        if can_reach_tier_2:
-            return "tuned"
-        else:
-            # Confidence threshold met but not enough recovery cycles for tier 2
-            return "stable"
-    else:
-        return "stable"
+
+    tier = _confidence_tier(heating_type, convergence_confidence)
+
+    # Tier gates (recovery cycle requirements) if tracker provided:
+    # confidence past tier 1 without enough recovery cycles stays collecting,
+    # confidence in tier 2 without enough recovery cycles is held at stable.
+    # Optimized (tier 3) has no recovery cycle requirement beyond tier 1.
+    if contribution_tracker is not None and tier:
+        if not contribution_tracker.can_reach_tier(1, mode):
+            tier = 0
+        elif tier == 2 and not contribution_tracker.can_reach_tier(2, mode):
+            tier = 1
+
+    return _TIER_STATUSES[tier]
 
 
 def _add_learning_object(thermostat: SmartThermostat, attrs: dict[str, Any]) -> None:
@@ -296,8 +296,8 @@ def mock_hass():
 # Time Travel Fixture
 # ============================================================================
 
+import time
 from datetime import timedelta, timezone
-from unittest.mock import patch
 
 
 class TimeTravelController:
@@ -320,7 +320,7 @@ class TimeTravelController:
 
 
 @pytest.fixture
-def time_travel():
+def time_travel(monkeypatch):
     """Fixture for deterministic time control in tests.
 
     Patches both dt_util.utcnow() and time.monotonic() to advance together.
@@ -333,30 +333,46 @@ def time_travel():
     """
     controller = TimeTravelController()
 
-    # Patch utcnow on the mocked dt_util module
-    # conftest.py sets up sys.modules["homeassistant.util.dt"] as a MagicMock
-    # We set utcnow to return our controlled time
+    # conftest.py sets up sys.modules["homeassistant.util.dt"] as a MagicMock;
+    # point its utcnow at our controlled time. monkeypatch restores both
+    # attributes after the test without building a patcher mock per test.
     from homeassistant.util import dt as dt_util
 
-    original_utcnow = dt_util.utcnow
-    dt_util.utcnow = controller.now
-
-    # Patch time.monotonic using unittest.mock.patch
-    with patch("time.monotonic", side_effect=lambda: controller.monotonic()):
-        yield controller
-
-    # Restore utcnow to original mock after test
-    dt_util.utcnow = original_utcnow
+    monkeypatch.setattr(dt_util, "utcnow", controller.now)
+    monkeypatch.setattr(time, "monotonic", controller.monotonic)
+    return controller
 
 
 # ============================================================================
 # Thermostat Factory Fixture
 # ============================================================================
 
+import functools
 from types import SimpleNamespace
 from typing import Union, Optional
 
 
+@functools.lru_cache(maxsize=8)
+def _default_gains(heating_type):
+    """Return (tau, PIDGains) for a heating type from physics-based initialization.
+
+    Uses reasonable default thermal time constants (hours) per heating type.
+    PIDGains is frozen, so the cached instance is safe to share between thermostats.
+    """
+    from custom_components.adaptive_climate.adaptive.physics import calculate_initial_pid
+    from custom_components.adaptive_climate.const import HeatingType, PIDGains
+
+    tau_map = {
+        HeatingType.FLOOR_HYDRONIC: 8.0,
+        HeatingType.RADIATOR: 4.0,
+        HeatingType.CONVECTOR: 2.0,
+        HeatingType.FORCED_AIR: 1.0,
+    }
+    tau = tau_map.get(heating_type, 4.0)
+    kp, ki, kd = calculate_initial_pid(tau, heating_type.value)
+    return tau, PIDGains(kp=kp, ki=ki, kd=kd, ke=0.0)
+
+
 @pytest.fixture
 def make_thermostat(mock_hass):
     """Factory fixture that creates real component instances wired together.
@@ -380,12 +396,11 @@ def make_thermostat(mock_hass):
             t2 = make_thermostat(heating_type=HeatingType.FLOOR_HYDRONIC)
     """
     from custom_components.adaptive_climate.adaptive.learning import AdaptiveLearner
-    from custom_components.adaptive_climate.adaptive.physics import calculate_initial_pid
     from custom_components.adaptive_climate.pid_controller import PID
     from custom_components.adaptive_climate.managers.pid_gains_manager import PIDGainsManager
     from custom_components.adaptive_climate.managers.cycle_tracker import CycleTrackerManager
     from custom_components.adaptive_climate.managers.events import CycleEventDispatcher
-    from custom_components.adaptive_climate.const import HeatingType, PIDGains, HEATING_TYPE_CHARACTERISTICS
+    from custom_components.adaptive_climate.const import HeatingType, HEATING_TYPE_CHARACTERISTICS
     from homeassistant.components.climate import HVACMode
 
     def _factory(heating_type: "HeatingType | str | None" = None):
@@ -408,16 +423,9 @@ def make_thermostat(mock_hass):
             chronic_approach_historic_scan=False,
         )
 
-        # Calculate physics-based PID gains
-        # Use reasonable defaults for thermal time constant based on heating type
-        tau_map = {
-            HeatingType.FLOOR_HYDRONIC: 8.0,
-            HeatingType.RADIATOR: 4.0,
-            HeatingType.CONVECTOR: 2.0,
-            HeatingType.FORCED_AIR: 1.0,
-        }
-        tau = tau_map.get(heating_type, 4.0)
-        kp, ki, kd = calculate_initial_pid(tau, heating_type.value)
+        # Physics-based PID gains (cached per heating type)
+        tau, initial_gains = _default_gains(heating_type)
+        kp, ki, kd = initial_gains.kp, initial_gains.ki, initial_gains.kd
 
         # Get heating type characteristics for derivative filter
         chars = HEATING_TYPE_CHARACTERISTICS[heating_type]
@@ -436,9 +444,6 @@ def make_thermostat(mock_hass):
             heating_type=heating_type.value,
         )
 
-        # Create PIDGains for gains manager
-        initial_gains = PIDGains(kp=kp, ki=ki, kd=kd, ke=0.0)
-
         # Create real PIDGainsManager
         gains_manager = PIDGainsManager(
             pid_controller=pid,
@@ -24,8 +24,10 @@ Tests kept and rewritten:
 
 import asyncio
 import pytest
+from collections import namedtuple
 from datetime import datetime, timezone
-from unittest.mock import Mock, AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock, patch
 
 
 # Mock Home Assistant exception classes
@@ -41,34 +43,35 @@ class MockHomeAssistantError(Exception):
     pass
 
 
-class MockHVACMode:
-    """Mock HVAC mode constants."""
+# Mock HVAC mode constants
+_HEAT, _COOL, _OFF, _HEAT_COOL = "heat", "cool", "off", "heat_cool"
+MockHVACMode = SimpleNamespace(HEAT=_HEAT, COOL=_COOL, OFF=_OFF, HEAT_COOL=_HEAT_COOL)
 
-    HEAT = "heat"
-    COOL = "cool"
-    OFF = "off"
-    HEAT_COOL = "heat_cool"
+# Mock preset mode constants
+MockPresetMode = SimpleNamespace(
+    NONE="none",
+    AWAY="away",
+    ECO="eco",
+    BOOST="boost",
+    COMFORT="comfort",
+    HOME="home",
+    SLEEP="sleep",
+    ACTIVITY="activity",
+)
 
 
-class MockPresetMode:
-    """Mock preset mode constants."""
+_HEATER_CONTROL_FAILED_EVENT = "adaptive_climate_heater_control_failed"
 
-    NONE = "none"
-    AWAY = "away"
-    ECO = "eco"
-    BOOST = "boost"
-    COMFORT = "comfort"
-    HOME = "home"
-    SLEEP = "sleep"
-    ACTIVITY = "activity"
+# (entity prefix, service domain, service, payload key) for valve-mode entities
+_VALVE_DISPATCH = (
+    ("light.", "light", "turn_on", "brightness_pct"),
+    ("valve.", "valve", "set_valve_position", "position"),
+)
+_DEFAULT_VALVE_DISPATCH = ("number", "set_value", "value")
 
 
-class MockState:
-    """Mock state object for restoration tests."""
-
-    def __init__(self, state, attributes=None):
-        self.state = state
-        self.attributes = attributes or {}
+# Mock state object for restoration tests
+MockState = namedtuple("MockState", ["state", "attributes"])
 
 
 class MockClimateEntity:
@@ -78,6 +81,60 @@ class MockClimateEntity:
     service call outcomes. No private attribute assertions.
     """
 
+    # Preset temperatures and managers initialized to None
+    _NONE_DEFAULTS = (
+        "_away_temp",
+        "_eco_temp",
+        "_boost_temp",
+        "_comfort_temp",
+        "_home_temp",
+        "_sleep_temp",
+        "_activity_temp",
+        "_pid_controller",
+        "_heater_controller",
+        "_night_setback_config",
+        "_night_setback_controller",
+        "_coordinator",
+        "_gains_manager",
+        "_contact_sensor_handler",
+        "_humidity_detector",
+        "_preheat_learner",
+    )
+
+    __slots__ = (
+        "hass",
+        "entity_id",
+        "_unique_id",
+        "_heater_entity_id",
+        "_cooler_entity_id",
+        "_demand_switch_entity_id",
+        "_sensor_entity_id",
+        "_ext_sensor_entity_id",
+        "_heater_polarity_invert",
+        "_hvac_mode",
+        "_ac_mode",
+        "_attr_preset_mode",
+        "_target_temp",
+        "min_temp",
+        "max_temp",
+        "_heater_control_failed",
+        "_last_heater_error",
+        "_control_output",
+        "_is_device_active",
+        *_NONE_DEFAULTS,
+    )
+
+    # (state attribute key, instance attribute) pairs restored by _restore_state
+    _RESTORE_PRESET_PAIRS = (
+        ("away_temp", "_away_temp"),
+        ("eco_temp", "_eco_temp"),
+        ("boost_temp", "_boost_temp"),
+        ("comfort_temp", "_comfort_temp"),
+        ("home_temp", "_home_temp"),
+        ("sleep_temp", "_sleep_temp"),
+        ("activity_temp", "_activity_temp"),
+    )
+
     def __init__(self, hass):
         self.hass = hass
         self.entity_id = "climate.test_thermostat"
@@ -92,7 +149,7 @@ class MockClimateEntity:
         self._heater_polarity_invert = False
 
         # Mode and state
-        self._hvac_mode = MockHVACMode.HEAT
+        self._hvac_mode = _HEAT
         self._ac_mode = False
         self._attr_preset_mode = MockPresetMode.NONE
 
@@ -100,13 +157,6 @@ class MockClimateEntity:
         self._target_temp = 21.0
         self.min_temp = 16.0
         self.max_temp = 30.0
-        self._away_temp = None
-        self._eco_temp = None
-        self._boost_temp = None
-        self._comfort_temp = None
-        self._home_temp = None
-        self._sleep_temp = None
-        self._activity_temp = None
 
         # Error tracking (observable via extra_state_attributes)
         self._heater_control_failed = False
@@ -116,16 +166,9 @@ class MockClimateEntity:
         self._control_output = 0.0
         self._is_device_active = False
 
-        # Managers (simplified for behavioral testing)
-        self._pid_controller = None
-        self._heater_controller = None
-        self._night_setback_config = None
-        self._night_setback_controller = None
-        self._coordinator = None
-        self._gains_manager = None
-        self._contact_sensor_handler = None
-        self._humidity_detector = None
-        self._preheat_learner = None
+        # Preset temperatures and managers (simplified for behavioral testing)
+        for name in self._NONE_DEFAULTS:
+            setattr(self, name, None)
 
     @property
     def hvac_mode(self):
@@ -137,11 +180,12 @@ class MockClimateEntity:
         """Return current HVAC action (observable behavior)."""
         if self._heater_control_failed:
             return "idle"
-        if self._hvac_mode == MockHVACMode.OFF:
+        mode = self._hvac_mode
+        if mode == _OFF:
             return "off"
-        if self._is_device_active:
-            return "heating" if self._hvac_mode == MockHVACMode.HEAT else "cooling"
-        return "idle"
+        if not self._is_device_active:
+            return "idle"
+        return "heating" if mode == _HEAT else "cooling"
 
     @property
     def target_temperature(self):
@@ -156,7 +200,7 @@ class MockClimateEntity:
     @property
     def heater_or_cooler_entity(self):
         """Return appropriate entity list based on mode."""
-        if self._hvac_mode == MockHVACMode.COOL and self._cooler_entity_id:
+        if self._hvac_mode == _COOL and self._cooler_entity_id:
             return self._cooler_entity_id
         return self._heater_entity_id or []
 
@@ -194,7 +238,7 @@ class MockClimateEntity:
     def _fire_heater_control_failed_event(self, entity_id: str, operation: str, error: str) -> None:
         """Fire heater control failed event."""
         self.hass.bus.async_fire(
-            "adaptive_climate_heater_control_failed",
+            _HEATER_CONTROL_FAILED_EVENT,
             {
                 "climate_entity_id": self.entity_id,
                 "heater_entity_id": entity_id,
@@ -211,58 +255,52 @@ class MockClimateEntity:
         """
         try:
             await self.hass.services.async_call(domain, service, data)
-            # Success: clear error state
-            self._heater_control_failed = False
-            self._last_heater_error = None
-            return True
-
-        except MockServiceNotFoundError as e:
-            self._heater_control_failed = True
-            self._last_heater_error = f"Service not found: {domain}.{service}"
-            self._fire_heater_control_failed_event(entity_id, service, str(e))
-            return False
-
-        except MockHomeAssistantError as e:
-            self._heater_control_failed = True
-            self._last_heater_error = str(e)
-            self._fire_heater_control_failed_event(entity_id, service, str(e))
-            return False
-
         except Exception as e:
+            error = str(e)
             self._heater_control_failed = True
-            self._last_heater_error = str(e)
-            self._fire_heater_control_failed_event(entity_id, service, str(e))
+            if isinstance(e, MockServiceNotFoundError):
+                self._last_heater_error = f"Service not found: {domain}.{service}"
+            else:
+                self._last_heater_error = error
+            self._fire_heater_control_failed_event(entity_id, service, error)
             return False
 
+        # Success: clear error state (only written when previously failed)
+        if self._heater_control_failed:
+            self._heater_control_failed = False
+            self._last_heater_error = None
+        return True
+
     async def _async_heater_turn_on(self):
         """Turn heater on with error handling."""
-        for heater_entity in self.heater_or_cooler_entity:
+        entities = self.heater_or_cooler_entity
+        service = "turn_off" if self._heater_polarity_invert else "turn_on"
+        for heater_entity in entities:
             data = {"entity_id": heater_entity}
-            service = "turn_off" if self._heater_polarity_invert else "turn_on"
             success = await self._async_call_heater_service(heater_entity, "homeassistant", service, data)
             if success:
                 self._is_device_active = True
 
     async def _async_heater_turn_off(self):
         """Turn heater off with error handling."""
-        for heater_entity in self.heater_or_cooler_entity:
+        entities = self.heater_or_cooler_entity
+        service = "turn_on" if self._heater_polarity_invert else "turn_off"
+        for heater_entity in entities:
             data = {"entity_id": heater_entity}
-            service = "turn_on" if self._heater_polarity_invert else "turn_off"
             await self._async_call_heater_service(heater_entity, "homeassistant", service, data)
         self._is_device_active = False
 
     async def _async_set_valve_value(self, value: float):
         """Set valve value with error handling."""
-        for heater_entity in self.heater_or_cooler_entity:
-            if heater_entity.startswith("light."):
-                data = {"entity_id": heater_entity, "brightness_pct": value}
-                await self._async_call_heater_service(heater_entity, "light", "turn_on", data)
-            elif heater_entity.startswith("valve."):
-                data = {"entity_id": heater_entity, "position": value}
-                await self._async_call_heater_service(heater_entity, "valve", "set_valve_position", data)
+        entities = self.heater_or_cooler_entity
+        for heater_entity in entities:
+            for prefix, domain, service, key in _VALVE_DISPATCH:
+                if heater_entity.startswith(prefix):
+                    break
             else:
-                data = {"entity_id": heater_entity, "value": value}
-                await self._async_call_heater_service(heater_entity, "number", "set_value", data)
+                domain, service, key = _DEFAULT_VALVE_DISPATCH
+            data = {"entity_id": heater_entity, key: value}
+            await self._async_call_heater_service(heater_entity, domain, service, data)
 
     def _restore_state(self, old_state):
         """Restore state from RestoreEntity (observable via public properties)."""
@@ -275,29 +313,25 @@ class MockClimateEntity:
         if old_state.state:
             self._hvac_mode = old_state.state
 
+        attrs = old_state.attributes
+
         # Restore target temperature
-        if old_state.attributes.get("temperature") is not None:
-            self._target_temp = old_state.attributes["temperature"]
+        temperature = attrs.get("temperature")
+        if temperature is not None:
+            self._target_temp = temperature
         else:
             self._target_temp = self.max_temp if self._ac_mode else self.min_temp
 
         # Restore preset mode
-        if old_state.attributes.get("preset_mode") is not None:
-            self._attr_preset_mode = old_state.attributes["preset_mode"]
+        preset_mode = attrs.get("preset_mode")
+        if preset_mode is not None:
+            self._attr_preset_mode = preset_mode
 
         # Restore preset temperatures
-        preset_attrs = [
-            "away_temp",
-            "eco_temp",
-            "boost_temp",
-            "comfort_temp",
-            "home_temp",
-            "sleep_temp",
-            "activity_temp",
-        ]
-        for attr in preset_attrs:
-            if old_state.attributes.get(attr) is not None:
-                setattr(self, f"_{attr}", old_state.attributes[attr])
+        for source_key, target_attr in self._RESTORE_PRESET_PAIRS:
+            value = attrs.get(source_key)
+            if value is not None:
+                setattr(self, target_attr, value)
 
     async def async_set_preset_mode(self, preset_mode: str):
         """Set preset mode and adjust target temperature."""
@@ -323,7 +357,7 @@ class MockClimateEntity:
         self._hvac_mode = hvac_mode
 
         # Turn off device if switching to OFF
-        if hvac_mode == MockHVACMode.OFF:
+        if hvac_mode == _OFF:
             await self._async_heater_turn_off()
 
     async def async_set_temperature(self, **kwargs):
@@ -332,16 +366,50 @@ class MockClimateEntity:
             self._target_temp = kwargs["temperature"]
 
 
+class _HassStub:
+    """Lightweight Home Assistant stub exposing only what MockClimateEntity uses."""
+
+    __slots__ = ("bus", "data", "services", "states")
+
+    def __init__(self):
+        self.services = SimpleNamespace(async_call=AsyncMock())
+        self.bus = SimpleNamespace(async_fire=Mock())
+        self.states = SimpleNamespace()
+        self.data = {}
+
+
 def _create_mock_hass():
     """Create mock Home Assistant instance."""
-    hass = MagicMock()
-    hass.services = MagicMock()
-    hass.services.async_call = AsyncMock()
-    hass.bus = MagicMock()
-    hass.bus.async_fire = Mock()
-    hass.states = MagicMock()
-    hass.data = {}
-    return hass
+    return _HassStub()
+
+
+@pytest.fixture(scope="module")
+def hass_template():
+    """Mock Home Assistant instance shared across the module."""
+    return _create_mock_hass()
+
+
+@pytest.fixture
+def hass(hass_template):
+    """Mock Home Assistant instance, reset after each test."""
+    yield hass_template
+    hass_template.services.async_call.reset_mock(return_value=True, side_effect=True)
+    hass_template.bus.async_fire.reset_mock()
+    hass_template.data.clear()
+
+
+@pytest.fixture
+def thermostat(hass):
+    """MockClimateEntity bound to the hass fixture."""
+    return MockClimateEntity(hass)
+
+
+@pytest.fixture(autouse=True)
+def _bind_thermostat(request, hass, thermostat):
+    """Expose hass and thermostat fixtures as self.hass / self.thermostat on test classes."""
+    if request.instance is not None:
+        request.instance.hass = hass
+        request.instance.thermostat = thermostat
 
 
 def _run_async(coro):
@@ -362,48 +430,41 @@ class TestHeaterControl:
 
     def test_successful_turn_on_clears_failure_state(self):
         """Verify successful turn_on clears previous error state."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-
         # Set initial error state
-        thermostat._heater_control_failed = True
-        thermostat._last_heater_error = "Previous error"
+        self.thermostat._heater_control_failed = True
+        self.thermostat._last_heater_error = "Previous error"
 
         # Successful turn_on should clear error
-        _run_async(thermostat._async_heater_turn_on())
+        _run_async(self.thermostat._async_heater_turn_on())
 
         # Observable: error state cleared in attributes
-        assert thermostat.hvac_action != "idle" or not thermostat._heater_control_failed
-        attrs = thermostat.extra_state_attributes
+        assert self.thermostat.hvac_action != "idle" or not self.thermostat._heater_control_failed
+        attrs = self.thermostat.extra_state_attributes
         assert "heater_control_failed" not in attrs
 
-    def test_service_not_found_sets_error_state(self):
-        """Verify service not found error sets observable error state."""
-        hass = _create_mock_hass()
-        hass.services.async_call.side_effect = MockServiceNotFoundError("Service not found")
-
-        thermostat = MockClimateEntity(hass)
+    @pytest.mark.parametrize(
+        "exc, fragment",
+        [
+            (MockServiceNotFoundError("Service not found"), "Service not found"),
+            (MockHomeAssistantError("HA Error"), "HA Error"),
+        ],
+        ids=["service_not_found", "home_assistant_error"],
+    )
+    def test_service_error_sets_state_and_fires_event(self, exc, fragment):
+        """Verify service errors set observable error state and fire an event."""
+        self.hass.services.async_call.side_effect = exc
 
-        _run_async(thermostat._async_heater_turn_on())
+        _run_async(self.thermostat._async_heater_turn_on())
 
         # Observable: error appears in attributes
-        attrs = thermostat.extra_state_attributes
+        attrs = self.thermostat.extra_state_attributes
         assert attrs.get("heater_control_failed") is True
-        assert "Service not found" in attrs.get("last_heater_error", "")
-        assert thermostat.hvac_action == "idle"
-
-    def test_service_error_fires_event(self):
-        """Verify service errors fire observable events."""
-        hass = _create_mock_hass()
-        hass.services.async_call.side_effect = MockHomeAssistantError("HA Error")
-
-        thermostat = MockClimateEntity(hass)
-
-        _run_async(thermostat._async_heater_turn_on())
+        assert fragment in attrs.get("last_heater_error", "")
+        assert self.thermostat.hvac_action == "idle"
 
         # Observable: event was fired
-        assert hass.bus.async_fire.called
-        call_args = hass.bus.async_fire.call_args
+        assert self.hass.bus.async_fire.called
+        call_args = self.hass.bus.async_fire.call_args
         assert call_args[0][0] == "adaptive_climate_heater_control_failed"
         event_data = call_args[0][1]
         assert event_data["climate_entity_id"] == "climate.test_thermostat"
@@ -411,58 +472,52 @@ class TestHeaterControl:
 
     def test_turn_off_success(self):
         """Verify turn_off successfully deactivates device."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._is_device_active = True
+        self.thermostat._is_device_active = True
 
-        _run_async(thermostat._async_heater_turn_off())
+        _run_async(self.thermostat._async_heater_turn_off())
 
         # Observable: device is inactive
-        hass.services.async_call.assert_called_once_with("homeassistant", "turn_off", {"entity_id": "switch.heater"})
-        assert thermostat._is_device_active is False
+        self.hass.services.async_call.assert_called_once_with(
+            "homeassistant", "turn_off", {"entity_id": "switch.heater"}
+        )
+        assert self.thermostat._is_device_active is False
 
     def test_valve_entity_uses_correct_service(self):
         """Verify valve entities use set_valve_position service."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._heater_entity_id = ["valve.heating_valve"]
+        self.thermostat._heater_entity_id = ["valve.heating_valve"]
 
-        _run_async(thermostat._async_set_valve_value(75.0))
+        _run_async(self.thermostat._async_set_valve_value(75.0))
 
         # Observable: correct service called
-        hass.services.async_call.assert_called_once_with(
+        self.hass.services.async_call.assert_called_once_with(
             "valve", "set_valve_position", {"entity_id": "valve.heating_valve", "position": 75.0}
         )
 
     def test_light_entity_uses_brightness(self):
         """Verify light entities use brightness_pct."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._heater_entity_id = ["light.heating_light"]
+        self.thermostat._heater_entity_id = ["light.heating_light"]
 
-        _run_async(thermostat._async_set_valve_value(50.0))
+        _run_async(self.thermostat._async_set_valve_value(50.0))
 
         # Observable: brightness service called
-        hass.services.async_call.assert_called_once_with(
+        self.hass.services.async_call.assert_called_once_with(
             "light", "turn_on", {"entity_id": "light.heating_light", "brightness_pct": 50.0}
         )
 
     def test_multiple_heaters_partial_failure(self):
         """Verify behavior when one heater succeeds and one fails."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._heater_entity_id = ["switch.heater1", "switch.heater2"]
+        self.thermostat._heater_entity_id = ["switch.heater1", "switch.heater2"]
 
         # First call succeeds, second fails
-        hass.services.async_call.side_effect = [
+        self.hass.services.async_call.side_effect = [
             None,  # Success
             MockServiceNotFoundError("Not found"),  # Failure
         ]
 
-        _run_async(thermostat._async_heater_turn_on())
+        _run_async(self.thermostat._async_heater_turn_on())
 
         # Observable: error state reflects the failure
-        attrs = thermostat.extra_state_attributes
+        attrs = self.thermostat.extra_state_attributes
         assert attrs.get("heater_control_failed") is True
 
 
@@ -474,26 +529,22 @@ class TestPresetModes:
 
     def test_away_preset_sets_away_temperature(self):
         """Verify away preset changes target temperature."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._away_temp = 16.0
-        thermostat._target_temp = 21.0
+        self.thermostat._away_temp = 16.0
+        self.thermostat._target_temp = 21.0
 
-        _run_async(thermostat.async_set_preset_mode(MockPresetMode.AWAY))
+        _run_async(self.thermostat.async_set_preset_mode(MockPresetMode.AWAY))
 
         # Observable: preset and temperature changed
-        assert thermostat.preset_mode == MockPresetMode.AWAY
-        assert thermostat.target_temperature == 16.0
+        assert self.thermostat.preset_mode == MockPresetMode.AWAY
+        assert self.thermostat.target_temperature == 16.0
 
     def test_preset_mode_in_state_attributes(self):
         """Verify preset temperatures appear in state attributes."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._away_temp = 16.0
-        thermostat._eco_temp = 18.0
-        thermostat._boost_temp = 25.0
+        self.thermostat._away_temp = 16.0
+        self.thermostat._eco_temp = 18.0
+        self.thermostat._boost_temp = 25.0
 
-        attrs = thermostat.extra_state_attributes
+        attrs = self.thermostat.extra_state_attributes
 
         # Observable: preset temps in attributes
         assert attrs["away_temp"] == 16.0
@@ -502,20 +553,18 @@ class TestPresetModes:
 
     def test_preset_none_keeps_current_temperature(self):
         """Verify setting preset to none doesn't change temperature."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._target_temp = 21.0
-        thermostat._comfort_temp = 22.0
+        self.thermostat._target_temp = 21.0
+        self.thermostat._comfort_temp = 22.0
 
         # Set comfort, then none
-        _run_async(thermostat.async_set_preset_mode(MockPresetMode.COMFORT))
-        assert thermostat.target_temperature == 22.0
+        _run_async(self.thermostat.async_set_preset_mode(MockPresetMode.COMFORT))
+        assert self.thermostat.target_temperature == 22.0
 
-        _run_async(thermostat.async_set_preset_mode(MockPresetMode.NONE))
+        _run_async(self.thermostat.async_set_preset_mode(MockPresetMode.NONE))
 
         # Observable: preset changed but temp stays at comfort level
-        assert thermostat.preset_mode == MockPresetMode.NONE
-        assert thermostat.target_temperature == 22.0
+        assert self.thermostat.preset_mode == MockPresetMode.NONE
+        assert self.thermostat.target_temperature == 22.0
 
 
 class TestStateRestoration:
@@ -527,31 +576,22 @@ class TestStateRestoration:
 
     def test_restore_target_temperature(self):
         """Verify target temperature restored from old state."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-
         old_state = MockState("heat", {"temperature": 21.5})
-        thermostat._restore_state(old_state)
+        self.thermostat._restore_state(old_state)
 
         # Observable: target temp restored
-        assert thermostat.target_temperature == 21.5
+        assert self.thermostat.target_temperature == 21.5
 
     def test_restore_preset_mode(self):
         """Verify preset mode restored from old state."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-
         old_state = MockState("heat", {"temperature": 21.0, "preset_mode": "away"})
-        thermostat._restore_state(old_state)
+        self.thermostat._restore_state(old_state)
 
         # Observable: preset restored
-        assert thermostat.preset_mode == "away"
+        assert self.thermostat.preset_mode == "away"
 
     def test_restore_preset_temperatures(self):
         """Verify preset temperatures restored from attributes."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-
         old_state = MockState(
             "heat",
             {
@@ -561,58 +601,49 @@ class TestStateRestoration:
                 "boost_temp": 25.0,
             },
         )
-        thermostat._restore_state(old_state)
+        self.thermostat._restore_state(old_state)
 
         # Observable: preset temps in state attributes
-        attrs = thermostat.extra_state_attributes
+        attrs = self.thermostat.extra_state_attributes
         assert attrs["away_temp"] == 16.0
         assert attrs["eco_temp"] == 18.0
         assert attrs["boost_temp"] == 25.0
 
     def test_restore_hvac_mode(self):
         """Verify HVAC mode restored from state."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-
         old_state = MockState("cool", {"temperature": 24.0})
-        thermostat._restore_state(old_state)
+        self.thermostat._restore_state(old_state)
 
         # Observable: mode restored
-        assert thermostat.hvac_mode == "cool"
+        assert self.thermostat.hvac_mode == "cool"
 
     def test_no_old_state_uses_defaults_heat_mode(self):
         """Verify defaults applied when no old state (heat mode)."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._ac_mode = False
+        self.thermostat._ac_mode = False
 
-        thermostat._restore_state(None)
+        self.thermostat._restore_state(None)
 
         # Observable: default is min_temp for heat
-        assert thermostat.target_temperature == thermostat.min_temp
+        assert self.thermostat.target_temperature == self.thermostat.min_temp
 
     def test_no_old_state_uses_defaults_cool_mode(self):
         """Verify defaults applied when no old state (cool mode)."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._ac_mode = True
+        self.thermostat._ac_mode = True
 
-        thermostat._restore_state(None)
+        self.thermostat._restore_state(None)
 
         # Observable: default is max_temp for cool
-        assert thermostat.target_temperature == thermostat.max_temp
+        assert self.thermostat.target_temperature == self.thermostat.max_temp
 
     def test_missing_temperature_attribute_uses_fallback(self):
         """Verify fallback when temperature attribute missing."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._ac_mode = False
+        self.thermostat._ac_mode = False
 
         old_state = MockState("heat", {})  # No temperature
-        thermostat._restore_state(old_state)
+        self.thermostat._restore_state(old_state)
 
         # Observable: fallback applied
-        assert thermostat.target_temperature == thermostat.min_temp
+        assert self.thermostat.target_temperature == self.thermostat.min_temp
 
 
 class TestHVACModes:
@@ -623,45 +654,39 @@ class TestHVACModes:
 
     def test_set_hvac_mode_to_off_turns_off_heater(self):
         """Verify switching to OFF mode turns off heater."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._is_device_active = True
-        thermostat._hvac_mode = MockHVACMode.HEAT
+        self.thermostat._is_device_active = True
+        self.thermostat._hvac_mode = MockHVACMode.HEAT
 
-        _run_async(thermostat.async_set_hvac_mode(MockHVACMode.OFF))
+        _run_async(self.thermostat.async_set_hvac_mode(MockHVACMode.OFF))
 
         # Observable: mode changed and heater turned off
-        assert thermostat.hvac_mode == MockHVACMode.OFF
-        hass.services.async_call.assert_called_once_with("homeassistant", "turn_off", {"entity_id": "switch.heater"})
+        assert self.thermostat.hvac_mode == MockHVACMode.OFF
+        self.hass.services.async_call.assert_called_once_with(
+            "homeassistant", "turn_off", {"entity_id": "switch.heater"}
+        )
 
     def test_hvac_action_off_when_mode_off(self):
         """Verify hvac_action is 'off' when mode is OFF."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._hvac_mode = MockHVACMode.OFF
+        self.thermostat._hvac_mode = MockHVACMode.OFF
 
         # Observable: action reflects mode
-        assert thermostat.hvac_action == "off"
+        assert self.thermostat.hvac_action == "off"
 
     def test_hvac_action_heating_when_active(self):
         """Verify hvac_action is 'heating' when device active in heat mode."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._hvac_mode = MockHVACMode.HEAT
-        thermostat._is_device_active = True
+        self.thermostat._hvac_mode = MockHVACMode.HEAT
+        self.thermostat._is_device_active = True
 
         # Observable: action shows heating
-        assert thermostat.hvac_action == "heating"
+        assert self.thermostat.hvac_action == "heating"
 
     def test_hvac_action_idle_when_not_active(self):
         """Verify hvac_action is 'idle' when device not active."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._hvac_mode = MockHVACMode.HEAT
-        thermostat._is_device_active = False
+        self.thermostat._hvac_mode = MockHVACMode.HEAT
+        self.thermostat._is_device_active = False
 
         # Observable: action shows idle
-        assert thermostat.hvac_action == "idle"
+        assert self.thermostat.hvac_action == "idle"
 
 
 class TestStateAttributes:
@@ -673,10 +698,7 @@ class TestStateAttributes:
 
     def test_basic_attributes_present(self):
         """Verify basic attributes always present."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-
-        attrs = thermostat.extra_state_attributes
+        attrs = self.thermostat.extra_state_attributes
 
         # Observable: required fields present
         assert "integration" in attrs
@@ -685,12 +707,10 @@ class TestStateAttributes:
 
     def test_preset_temperatures_only_when_set(self):
         """Verify preset temperatures only in attributes when configured."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-        thermostat._away_temp = 16.0
+        self.thermostat._away_temp = 16.0
         # eco_temp not set
 
-        attrs = thermostat.extra_state_attributes
+        attrs = self.thermostat.extra_state_attributes
 
         # Observable: only set presets appear
         assert "away_temp" in attrs
@@ -699,22 +719,27 @@ class TestStateAttributes:
 
     def test_error_attributes_only_when_failed(self):
         """Verify error attributes only present when control failed."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-
         # No error initially
-        attrs1 = thermostat.extra_state_attributes
+        attrs1 = self.thermostat.extra_state_attributes
         assert "heater_control_failed" not in attrs1
 
         # Set error state
-        thermostat._heater_control_failed = True
-        thermostat._last_heater_error = "Test error"
+        self.thermostat._heater_control_failed = True
+        self.thermostat._last_heater_error = "Test error"
 
-        attrs2 = thermostat.extra_state_attributes
+        attrs2 = self.thermostat.extra_state_attributes
         # Observable: error fields appear
         assert attrs2["heater_control_failed"] is True
         assert attrs2["last_heater_error"] == "Test error"
 
+    def test_mutating_returned_attributes_does_not_leak(self):
+        """Verify callers mutating the returned dict do not affect later reads."""
+        attrs1 = self.thermostat.extra_state_attributes
+        attrs1["control_output"] = 99.0
+
+        attrs2 = self.thermostat.extra_state_attributes
+        assert attrs2["control_output"] == 0.0
+
 
 class TestNightSetback:
     """Tests for night setback functionality.
@@ -725,18 +750,15 @@ class TestNightSetback:
 
     def test_night_setback_config_stored(self):
         """Verify night setback config can be set."""
-        hass = _create_mock_hass()
-        thermostat = MockClimateEntity(hass)
-
         config = {
             "start_time": "22:00",
             "end_time": "07:00",
             "setback_delta": 2.0,
         }
-        thermostat._night_setback_config = config
+        self.thermostat._night_setback_config = config
 
         # Observable: config stored
-        assert thermostat._night_setback_config == config
+        assert self.thermostat._night_setback_config == config
 
 
 # ==============================================================================
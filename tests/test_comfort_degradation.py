@@ -1,6 +1,7 @@
 """Tests for comfort degradation detection."""
 
-from unittest.mock import AsyncMock, MagicMock
+from itertools import repeat
+
 import pytest
 
 from custom_components.adaptive_climate.managers.comfort_degradation import (
@@ -21,22 +22,19 @@ def detector():
 
 def test_triggers_below_absolute_threshold(detector):
     """Score < 65 fires degradation."""
-    for _ in range(50):
-        detector.record_score(80.0)
+    detector.record_scores(repeat(80.0, 50))
     assert detector.check_degradation(60.0) is True
 
 
 def test_triggers_on_large_drop(detector):
     """Drop >15 points from rolling avg fires."""
-    for _ in range(50):
-        detector.record_score(85.0)
+    detector.record_scores(repeat(85.0, 50))
     assert detector.check_degradation(68.0) is True
 
 
 def test_no_trigger_normal_fluctuation(detector):
     """Small drops are ignored."""
-    for _ in range(50):
-        detector.record_score(80.0)
+    detector.record_scores(repeat(80.0, 50))
     assert detector.check_degradation(75.0) is False
 
 
@@ -73,10 +71,7 @@ def test_build_context_both_causes(detector):
 
 def test_rolling_average(detector):
     """Rolling average computed correctly."""
-    for _ in range(10):
-        detector.record_score(80.0)
-    for _ in range(10):
-        detector.record_score(90.0)
+    detector.record_scores([80.0] * 10 + [90.0] * 10)
     avg = detector.rolling_average
     assert avg is not None
     assert 84.0 <= avg <= 86.0
@@ -98,6 +93,20 @@ def test_max_samples_respected():
     for i in range(20):
         detector.record_score(float(i))
     assert len(detector._samples) == 10
+    # Running sum tracks only the retained samples (10..19)
+    assert detector._sum == sum(range(10, 20))
+
+
+def test_record_scores_respects_max_samples():
+    """Bulk recording evicts the oldest samples like repeated record_score calls."""
+    detector = ComfortDegradationDetector(
+        zone_id="test",
+        zone_name="Test",
+        max_samples=10,
+    )
+    detector.record_scores(float(i) for i in range(20))
+    assert list(detector._samples) == [float(i) for i in range(10, 20)]
+    assert detector._sum == sum(range(10, 20))
 
 
 def test_threshold_constants():
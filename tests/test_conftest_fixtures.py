@@ -1,21 +1,37 @@
 """Tests for shared test fixtures in conftest.py."""
 
+import functools
+import time
 from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 
-class TestMockHass:
-    """Tests for the shared mock_hass fixture."""
+from homeassistant.components.climate import HVACMode
+from homeassistant.util import dt as dt_util
+
+from custom_components.adaptive_climate.adaptive.learning import AdaptiveLearner
+from custom_components.adaptive_climate.const import HeatingType
+from custom_components.adaptive_climate.managers.events import CycleEventDispatcher
+from custom_components.adaptive_climate.managers.pid_gains_manager import PIDGainsManager
+from custom_components.adaptive_climate.pid_controller import PID
 
-    def test_mock_hass_has_states(self, mock_hass):
-        assert hasattr(mock_hass, "states")
-        assert isinstance(mock_hass.states, MagicMock)
 
-    def test_mock_hass_has_async_services(self, mock_hass):
-        assert isinstance(mock_hass.services.async_call, AsyncMock)
+class TestMockHass:
+    """Tests for the shared mock_hass fixture."""
 
-    def test_mock_hass_has_event_bus(self, mock_hass):
-        assert isinstance(mock_hass.bus.async_fire, AsyncMock)
+    @pytest.mark.parametrize(
+        "attr_path, expected_type",
+        [
+            ("states", MagicMock),
+            ("services.async_call", AsyncMock),
+            ("bus.async_fire", AsyncMock),
+            ("async_create_task", MagicMock),
+        ],
+    )
+    def test_mock_hass_attrs(self, mock_hass, attr_path, expected_type):
+        obj = functools.reduce(getattr, attr_path.split("."), mock_hass)
+        assert isinstance(obj, expected_type)
 
     def test_mock_hass_has_data_structure(self, mock_hass):
         assert "adaptive_climate" in mock_hass.data
@@ -23,10 +39,6 @@ class TestMockHass:
         assert "coordinator" in ac_data
         assert "learning_store" in ac_data
 
-    def test_mock_hass_has_async_create_task(self, mock_hass):
-        assert hasattr(mock_hass, "async_create_task")
-        assert isinstance(mock_hass.async_create_task, MagicMock)
-
     def test_mock_hass_has_async_call_later(self, mock_hass):
         """async_call_later should return a cancel callback."""
         assert hasattr(mock_hass, "async_call_later")
@@ -66,8 +78,6 @@ class TestTimeTravel:
 
     def test_utcnow_patched(self, time_travel):
         """dt_util.utcnow() returns the controlled time."""
-        from homeassistant.util import dt as dt_util
-
         start = time_travel.now()
         assert dt_util.utcnow() == start
 
@@ -76,8 +86,6 @@ class TestTimeTravel:
 
     def test_monotonic_patched(self, time_travel):
         """time.monotonic() returns the controlled time."""
-        import time
-
         start = time_travel.monotonic()
         assert time.monotonic() == start
 
@@ -107,11 +115,6 @@ class TestMakeThermostat:
 
     def test_components_are_real_instances(self, make_thermostat):
         """Components are real instances, not mocks."""
-        from custom_components.adaptive_climate.adaptive.learning import AdaptiveLearner
-        from custom_components.adaptive_climate.pid_controller import PID
-        from custom_components.adaptive_climate.managers.pid_gains_manager import PIDGainsManager
-        from custom_components.adaptive_climate.managers.events import CycleEventDispatcher
-
         t = make_thermostat()
         assert isinstance(t.learner, AdaptiveLearner)
         assert isinstance(t.pid, PID)
@@ -120,16 +123,12 @@ class TestMakeThermostat:
 
     def test_heating_type_override(self, make_thermostat):
         """Factory accepts heating_type parameter."""
-        from custom_components.adaptive_climate.const import HeatingType
-
         t = make_thermostat(heating_type=HeatingType.FLOOR_HYDRONIC)
         assert t.learner._heating_type == HeatingType.FLOOR_HYDRONIC
         assert t.heating_rate_learner._heating_type == HeatingType.FLOOR_HYDRONIC
 
     def test_default_heating_type_is_radiator(self, make_thermostat):
         """Default heating type is radiator."""
-        from custom_components.adaptive_climate.const import HeatingType
-
         t = make_thermostat()
         assert t.learner._heating_type == HeatingType.RADIATOR
 
@@ -142,8 +141,6 @@ class TestMakeThermostat:
 
     def test_gains_manager_synced_to_pid(self, make_thermostat):
         """PIDGainsManager gains are synced to PID controller."""
-        from homeassistant.components.climate import HVACMode
-
         t = make_thermostat()
         gains = t.gains_manager.get_gains(HVACMode.HEAT)
         # Gains should be set and non-zero
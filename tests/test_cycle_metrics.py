@@ -1,420 +1,236 @@
 """Tests for cycle metrics recorder."""
 
-from datetime import datetime
-from unittest.mock import MagicMock, Mock
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from custom_components.adaptive_climate.adaptive import cycle_analysis
+from custom_components.adaptive_climate.adaptive.learning import AdaptiveLearner
 from custom_components.adaptive_climate.const import HeatingType
 from custom_components.adaptive_climate.managers.cycle_metrics import CycleMetricsRecorder
 
+# Shared timestamps (datetimes are immutable, so sharing them between tests is safe)
+CYCLE_START = datetime(2025, 1, 15, 10, 0, 0)
+DEVICE_OFF = datetime(2025, 1, 15, 10, 30, 0)
 
-@pytest.fixture
-def mock_hass():
-    """Create a mock Home Assistant instance."""
-    hass = MagicMock()
-    hass.async_create_task = MagicMock()
-    return hass
 
+def _t(minutes):
+    """Return the timestamp the given number of minutes after DEVICE_OFF."""
+    return DEVICE_OFF + timedelta(minutes=minutes)
 
-@pytest.fixture
-def mock_adaptive_learner():
-    """Create a mock adaptive learner."""
-    learner = MagicMock()
-    learner.add_cycle_metrics = MagicMock()
-    learner.update_convergence_tracking = MagicMock()
-    learner.update_convergence_confidence = MagicMock()
-    learner.is_in_validation_mode = MagicMock(return_value=False)
-    return learner
-
-
-@pytest.fixture
-def mock_callbacks():
-    """Create mock callback functions."""
-    return {
-        "get_target_temp": Mock(return_value=20.0),
-        "get_current_temp": Mock(return_value=18.0),
-        "get_hvac_mode": Mock(return_value="heat"),
-        "get_in_grace_period": Mock(return_value=False),
-    }
 
+# Shared (timestamp, temperature) histories at 5 minute intervals; tests pass a fresh list(...) copy
+HIST_HEATING = tuple(
+    (CYCLE_START + timedelta(minutes=m), t)
+    for m, t in [(0, 18.0), (5, 18.5), (10, 19.0), (15, 19.5), (20, 20.0), (25, 20.2)]
+)
+HIST_COOLING = tuple(
+    (CYCLE_START + timedelta(minutes=m), t)
+    for m, t in [(0, 22.0), (5, 21.5), (10, 21.0), (15, 20.5), (20, 20.0), (25, 19.8)]
+)
 
-class TestExtendedSettlingWindow:
-    """Test extended settling window for slow systems."""
 
-    def test_settling_window_by_heating_type(self, mock_hass, mock_adaptive_learner, mock_callbacks):
-        """Settling window varies by heating type."""
-        # Create recorder for floor_hydronic (slowest system)
-        floor_recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_floor",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            heating_type=HeatingType.FLOOR_HYDRONIC,
-        )
+def _const(value):
+    """Return a zero-argument callable that always returns value."""
+    return lambda: value
 
-        # Create recorder for forced_air (fastest system)
-        forced_recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_forced",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            heating_type=HeatingType.FORCED_AIR,
-        )
 
-        # Verify settling windows match const.py expectations
-        assert floor_recorder.get_settling_window_minutes() == 60
-        assert forced_recorder.get_settling_window_minutes() == 10
+@pytest.fixture(scope="module")
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    return SimpleNamespace(async_create_task=MagicMock(), data={})
 
-    def test_settling_window_defaults_to_30_when_no_heating_type(
-        self, mock_hass, mock_adaptive_learner, mock_callbacks
-    ):
-        """Settling window defaults to 30 minutes when heating_type is None."""
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_no_type",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            heating_type=None,
-        )
 
-        # Should default to 30 minutes (radiator-like default)
-        assert recorder.get_settling_window_minutes() == 30
-
-    def test_settling_start_includes_transport_delay(self, mock_hass, mock_adaptive_learner, mock_callbacks):
-        """Settling window starts after transport delay."""
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_transport",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            heating_type=HeatingType.FLOOR_HYDRONIC,
-        )
+@pytest.fixture(scope="module")
+def mock_adaptive_learner():
+    """Create a mock adaptive learner.
 
-        # Set transport delay (5 minutes)
-        recorder.set_transport_delay(5.0)
-
-        # Set device off time
-        device_off_time = datetime(2025, 1, 15, 10, 30, 0)
-        recorder.set_device_off_time(device_off_time)
-
-        # Get settling start time (should account for transport delay)
-        settling_start = recorder.get_settling_start_time()
-
-        # Settling should start 5 minutes after device turned off (transport delay)
-        expected_start = datetime(2025, 1, 15, 10, 35, 0)
-        assert settling_start == expected_start
-
-    def test_settling_start_includes_valve_actuation(self, mock_hass, mock_adaptive_learner, mock_callbacks):
-        """Settling window starts after valve actuation time."""
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_valve",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            heating_type=HeatingType.FLOOR_HYDRONIC,
-            valve_actuation_time=120.0,  # 2 minutes in seconds
-        )
+    Specced against AdaptiveLearner, so accessing an attribute the real learner
+    does not have raises AttributeError instead of returning a nested mock.
+    """
+    learner = MagicMock(spec=AdaptiveLearner)
+    learner.is_in_validation_mode.return_value = False
+    return learner
 
-        # Set device off time
-        device_off_time = datetime(2025, 1, 15, 10, 30, 0)
-        recorder.set_device_off_time(device_off_time)
-
-        # Get settling start time (should account for half valve actuation time)
-        settling_start = recorder.get_settling_start_time()
-
-        # Settling should start 1 minute after device off (half of 2 min valve time)
-        expected_start = datetime(2025, 1, 15, 10, 31, 0)
-        assert settling_start == expected_start
-
-    def test_settling_start_includes_both_delays(self, mock_hass, mock_adaptive_learner, mock_callbacks):
-        """Settling window starts after both valve actuation and transport delay."""
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_both",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            heating_type=HeatingType.FLOOR_HYDRONIC,
-            valve_actuation_time=120.0,  # 2 minutes in seconds
-        )
 
-        # Set transport delay (5 minutes)
-        recorder.set_transport_delay(5.0)
-
-        # Set device off time
-        device_off_time = datetime(2025, 1, 15, 10, 30, 0)
-        recorder.set_device_off_time(device_off_time)
-
-        # Get settling start time (should account for both delays)
-        settling_start = recorder.get_settling_start_time()
-
-        # Settling should start 6 minutes after device off:
-        # - Half valve actuation: 1 min
-        # - Transport delay: 5 min
-        expected_start = datetime(2025, 1, 15, 10, 36, 0)
-        assert settling_start == expected_start
-
-    def test_settling_start_returns_device_off_when_no_delays(self, mock_hass, mock_adaptive_learner, mock_callbacks):
-        """Settling starts at device off time when no delays are present."""
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_no_delays",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            heating_type=HeatingType.CONVECTOR,
-        )
+@pytest.fixture(scope="module")
+def recorder_kwargs(mock_hass, mock_adaptive_learner):
+    """Constructor arguments shared by every CycleMetricsRecorder in this module.
 
-        # Set device off time
-        device_off_time = datetime(2025, 1, 15, 10, 30, 0)
-        recorder.set_device_off_time(device_off_time)
-
-        # Get settling start time (should be same as device off time)
-        settling_start = recorder.get_settling_start_time()
-
-        assert settling_start == device_off_time
-
-    def test_settling_start_returns_none_when_no_device_off(self, mock_hass, mock_adaptive_learner, mock_callbacks):
-        """Settling start returns None when device_off_time is not set."""
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_no_off",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            heating_type=HeatingType.FLOOR_HYDRONIC,
-        )
+    Callbacks are plain constant getters since no test asserts on their calls.
+    """
+    return {
+        "hass": mock_hass,
+        "adaptive_learner": mock_adaptive_learner,
+        "get_target_temp": _const(20.0),
+        "get_current_temp": _const(18.0),
+        "get_hvac_mode": _const("heat"),
+        "get_in_grace_period": _const(False),
+        "min_cycle_duration_minutes": 5,
+    }
 
-        # Don't set device_off_time
 
-        # Get settling start time (should return None)
-        settling_start = recorder.get_settling_start_time()
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_hass, mock_adaptive_learner):
+    """Clear call history on the module-scoped mocks before each test."""
+    mock_hass.async_create_task.reset_mock()
+    mock_adaptive_learner.reset_mock()
 
-        assert settling_start is None
 
+@pytest.fixture(scope="module")
+def make_recorder(recorder_kwargs):
+    """Return a factory building a fresh recorder from the shared kwargs plus overrides."""
 
-class TestRiseTimeThreshold:
-    """Test rise_time calculation uses heating-type-specific thresholds."""
+    def _make(**overrides):
+        return CycleMetricsRecorder(**{**recorder_kwargs, "zone_id": "test_zone", **overrides})
 
-    def test_rise_time_uses_floor_hydronic_threshold(self, mock_hass, mock_adaptive_learner, mock_callbacks):
-        """Rise time calculation uses 0.5°C threshold for floor_hydronic."""
-        from datetime import timedelta
-        from unittest.mock import patch
-
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_floor",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            cold_tolerance=0.5,
-            heating_type=HeatingType.FLOOR_HYDRONIC,
-        )
+    return _make
 
-        # Create temperature history reaching target within 0.5°C (but not 0.05°C)
-        cycle_start = datetime(2025, 1, 15, 10, 0, 0)
-        target_temp = 20.0
-        start_temp = 18.0
 
-        temperature_history = [
-            (cycle_start, 18.0),
-            (cycle_start + timedelta(minutes=10), 18.5),
-            (cycle_start + timedelta(minutes=20), 19.0),
-            (cycle_start + timedelta(minutes=30), 19.5),
-            (cycle_start + timedelta(minutes=40), 19.75),  # Within 0.5°C of target
-            (cycle_start + timedelta(minutes=50), 19.8),
-        ]
+@pytest.fixture(scope="module")
+def recorder_factory(make_recorder):
+    """Return recorders cached per (heating_type, valve_actuation_time) configuration.
 
-        # Mock calculate_rise_time to capture the threshold parameter
-        with patch("custom_components.adaptive_climate.adaptive.cycle_analysis.calculate_rise_time") as mock_calc:
-            mock_calc.return_value = 40.0  # 40 minutes to reach target
+    Settling-window tests only exercise timing configuration, so one recorder per
+    configuration is shared across the module. Per-cycle timing state is cleared on
+    every retrieval to keep tests independent.
+    """
+    cache: dict[tuple, CycleMetricsRecorder] = {}
 
-            # Record cycle metrics (this calls calculate_rise_time internally)
-            recorder.record_cycle_metrics(
-                cycle_start_time=cycle_start,
-                cycle_target_temp=target_temp,
-                cycle_state_value="settling",
-                temperature_history=temperature_history,
-                outdoor_temp_history=[],
+    def _make(heating_type=None, valve_actuation_time=0.0):
+        key = (heating_type, valve_actuation_time)
+        recorder = cache.get(key)
+        if recorder is None:
+            recorder = cache[key] = make_recorder(
+                heating_type=heating_type,
+                valve_actuation_time=valve_actuation_time,
             )
+        recorder._device_off_time = None
+        recorder.reset_cycle_metrics()
+        return recorder
 
-            # Verify calculate_rise_time was called with 0.5°C threshold (floor_hydronic)
-            mock_calc.assert_called_once()
-            call_kwargs = mock_calc.call_args[1]
-            assert "threshold" in call_kwargs
-            assert call_kwargs["threshold"] == 0.5
-
-    def test_rise_time_uses_forced_air_threshold(self, mock_hass, mock_adaptive_learner, mock_callbacks):
-        """Rise time calculation uses 0.15°C threshold for forced_air."""
-        from datetime import timedelta
-        from unittest.mock import patch
-
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_forced",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            cold_tolerance=0.15,
-            heating_type=HeatingType.FORCED_AIR,
-        )
+    return _make
 
-        # Create temperature history
-        cycle_start = datetime(2025, 1, 15, 10, 0, 0)
-        target_temp = 20.0
 
-        temperature_history = [
-            (cycle_start, 18.0),
-            (cycle_start + timedelta(minutes=5), 18.5),
-            (cycle_start + timedelta(minutes=10), 19.0),
-            (cycle_start + timedelta(minutes=15), 19.5),
-            (cycle_start + timedelta(minutes=20), 19.9),  # Within 0.15°C of target
-        ]
+class TestExtendedSettlingWindow:
+    """Test extended settling window for slow systems."""
 
-        # Mock calculate_rise_time to capture the threshold parameter
-        with patch("custom_components.adaptive_climate.adaptive.cycle_analysis.calculate_rise_time") as mock_calc:
-            mock_calc.return_value = 20.0  # 20 minutes to reach target
+    @pytest.mark.parametrize(
+        "heating_type, expected_minutes",
+        [
+            (HeatingType.FLOOR_HYDRONIC, 60),  # slowest system
+            (HeatingType.RADIATOR, 30),
+            (HeatingType.CONVECTOR, 15),
+            (HeatingType.FORCED_AIR, 10),  # fastest system
+            (None, 30),  # radiator-like default
+        ],
+    )
+    def test_settling_window_minutes(self, recorder_factory, heating_type, expected_minutes):
+        """Settling window varies by heating type and defaults to 30 minutes."""
+        assert recorder_factory(heating_type).get_settling_window_minutes() == expected_minutes
+
+    @pytest.mark.parametrize(
+        "heating_type, valve_actuation_time, transport_delay, device_off_time, expected_start",
+        [
+            # Transport delay (5 min) pushes settling start back 5 minutes
+            (HeatingType.FLOOR_HYDRONIC, 0.0, 5.0, DEVICE_OFF, _t(5)),
+            # Half of the 2 min valve actuation time
+            (HeatingType.FLOOR_HYDRONIC, 120.0, None, DEVICE_OFF, _t(1)),
+            # Half valve actuation (1 min) + transport delay (5 min)
+            (HeatingType.FLOOR_HYDRONIC, 120.0, 5.0, DEVICE_OFF, _t(6)),
+            # No delays: settling starts at device off time
+            (HeatingType.CONVECTOR, 0.0, None, DEVICE_OFF, DEVICE_OFF),
+            # No device off time: no settling start
+            (HeatingType.FLOOR_HYDRONIC, 0.0, None, None, None),
+        ],
+        ids=["transport_delay", "valve_actuation", "both_delays", "no_delays", "no_device_off"],
+    )
+    def test_settling_start(
+        self,
+        recorder_factory,
+        heating_type,
+        valve_actuation_time,
+        transport_delay,
+        device_off_time,
+        expected_start,
+    ):
+        """Settling window starts after valve actuation and transport delays."""
+        recorder = recorder_factory(heating_type, valve_actuation_time=valve_actuation_time)
+        if transport_delay is not None:
+            recorder.set_transport_delay(transport_delay)
+        if device_off_time is not None:
+            recorder.set_device_off_time(device_off_time)
 
-            # Record cycle metrics
-            recorder.record_cycle_metrics(
-                cycle_start_time=cycle_start,
-                cycle_target_temp=target_temp,
-                cycle_state_value="settling",
-                temperature_history=temperature_history,
-                outdoor_temp_history=[],
-            )
+        assert recorder.get_settling_start_time() == expected_start
 
-            # Verify calculate_rise_time was called with 0.15°C threshold (forced_air)
-            mock_calc.assert_called_once()
-            call_kwargs = mock_calc.call_args[1]
-            assert "threshold" in call_kwargs
-            assert call_kwargs["threshold"] == 0.15
-
-    def test_rise_time_defaults_to_0_2_when_no_cold_tolerance(self, mock_hass, mock_adaptive_learner, mock_callbacks):
-        """Rise time calculation defaults to 0.2°C threshold when cold_tolerance is None."""
-        from datetime import timedelta
-        from unittest.mock import patch
-
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_no_type",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
-            heating_type=None,
-        )
 
-        # Create temperature history (need at least 5 samples)
-        cycle_start = datetime(2025, 1, 15, 10, 0, 0)
-        target_temp = 20.0
+class TestRiseTimeThreshold:
+    """Test rise_time calculation uses heating-type-specific thresholds."""
 
-        temperature_history = [
-            (cycle_start, 18.0),
-            (cycle_start + timedelta(minutes=5), 18.5),
-            (cycle_start + timedelta(minutes=10), 19.0),
-            (cycle_start + timedelta(minutes=15), 19.5),
-            (cycle_start + timedelta(minutes=20), 20.0),
-        ]
+    @pytest.mark.parametrize(
+        "heating_type, cold_tolerance, expected_threshold, expected_in_kwargs",
+        [
+            (HeatingType.FLOOR_HYDRONIC, 0.5, 0.5, True),
+            (HeatingType.FORCED_AIR, 0.15, 0.15, True),
+            # No cold_tolerance: calculate_rise_time falls back to its 0.2°C default
+            (None, None, None, False),
+        ],
+        ids=["floor_hydronic", "forced_air", "default"],
+    )
+    def test_rise_time_threshold(
+        self,
+        make_recorder,
+        heating_type,
+        cold_tolerance,
+        expected_threshold,
+        expected_in_kwargs,
+    ):
+        """Rise time calculation receives cold_tolerance as its threshold when configured."""
+        overrides = {"heating_type": heating_type}
+        if cold_tolerance is not None:
+            overrides["cold_tolerance"] = cold_tolerance
+        recorder = make_recorder(**overrides)
 
         # Mock calculate_rise_time to capture the threshold parameter
-        with patch("custom_components.adaptive_climate.adaptive.cycle_analysis.calculate_rise_time") as mock_calc:
+        with patch.object(cycle_analysis, "calculate_rise_time") as mock_calc:
             mock_calc.return_value = 20.0
 
-            # Record cycle metrics
             recorder.record_cycle_metrics(
-                cycle_start_time=cycle_start,
-                cycle_target_temp=target_temp,
+                cycle_start_time=CYCLE_START,
+                cycle_target_temp=20.0,
                 cycle_state_value="settling",
-                temperature_history=temperature_history,
+                # First 5 samples rise from 18.0°C to the 20.0°C target
+                temperature_history=list(HIST_HEATING[:5]),
                 outdoor_temp_history=[],
             )
 
-            # Verify calculate_rise_time was called without threshold parameter
-            # (will use default 0.2°C from calculate_rise_time function)
-            mock_calc.assert_called_once()
-            call_kwargs = mock_calc.call_args[1]
-            assert "threshold" not in call_kwargs
+        mock_calc.assert_called_once()
+        call_kwargs = mock_calc.call_args[1]
+        assert ("threshold" in call_kwargs) is expected_in_kwargs
+        assert call_kwargs.get("threshold") == expected_threshold
 
 
 class TestStartingDeltaCalculation:
     """Test starting_delta calculation for weighted learning."""
 
-    def test_starting_delta_calculated_and_passed_to_cycle_metrics(
-        self, mock_hass, mock_adaptive_learner, mock_callbacks
-    ):
+    def test_starting_delta_calculated_and_passed_to_cycle_metrics(self, make_recorder, mock_adaptive_learner):
         """Starting delta is calculated from target_temp - start_temp and passed to CycleMetrics."""
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_starting_delta",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
+        recorder = make_recorder(
             heating_type=HeatingType.FLOOR_HYDRONIC,
         )
 
-        # Create temperature history starting at 18.0°C
-        start_time = datetime(2025, 1, 15, 10, 0, 0)
-        temperature_history = [
-            (datetime(2025, 1, 15, 10, 0, 0), 18.0),
-            (datetime(2025, 1, 15, 10, 5, 0), 18.5),
-            (datetime(2025, 1, 15, 10, 10, 0), 19.0),
-            (datetime(2025, 1, 15, 10, 15, 0), 19.5),
-            (datetime(2025, 1, 15, 10, 20, 0), 20.0),
-            (datetime(2025, 1, 15, 10, 25, 0), 20.2),
-        ]
-
-        # Target temp is 20.0 (from mock_callbacks)
+        # Target temp is 20.0 (from recorder_kwargs)
         # Start temp is 18.0
         # Expected starting_delta = 20.0 - 18.0 = 2.0
 
         # Record cycle
         recorder.record_cycle_metrics(
-            cycle_start_time=start_time,
+            cycle_start_time=CYCLE_START,
             cycle_target_temp=20.0,
             cycle_state_value="heating",
-            temperature_history=temperature_history,
+            temperature_history=list(HIST_HEATING),
             outdoor_temp_history=[],
         )
 
@@ -428,44 +244,23 @@ class TestStartingDeltaCalculation:
         # Verify starting_delta is calculated correctly
         assert cycle_metrics.starting_delta == 2.0
 
-    def test_starting_delta_with_cooling_mode(self, mock_hass, mock_adaptive_learner, mock_callbacks):
+    def test_starting_delta_with_cooling_mode(self, make_recorder, mock_adaptive_learner):
         """Starting delta is calculated for cooling mode (temp - target)."""
-        # Modify callbacks for cooling mode
-        mock_callbacks["get_hvac_mode"].return_value = "cool"
-
-        recorder = CycleMetricsRecorder(
-            hass=mock_hass,
-            zone_id="test_cooling_delta",
-            adaptive_learner=mock_adaptive_learner,
-            get_target_temp=mock_callbacks["get_target_temp"],
-            get_current_temp=mock_callbacks["get_current_temp"],
-            get_hvac_mode=mock_callbacks["get_hvac_mode"],
-            get_in_grace_period=mock_callbacks["get_in_grace_period"],
-            min_cycle_duration_minutes=5,
+        recorder = make_recorder(
+            get_hvac_mode=_const("cool"),
             heating_type=HeatingType.FORCED_AIR,
         )
 
-        # Create temperature history starting at 22.0°C (above target)
-        start_time = datetime(2025, 1, 15, 10, 0, 0)
-        temperature_history = [
-            (datetime(2025, 1, 15, 10, 0, 0), 22.0),
-            (datetime(2025, 1, 15, 10, 5, 0), 21.5),
-            (datetime(2025, 1, 15, 10, 10, 0), 21.0),
-            (datetime(2025, 1, 15, 10, 15, 0), 20.5),
-            (datetime(2025, 1, 15, 10, 20, 0), 20.0),
-            (datetime(2025, 1, 15, 10, 25, 0), 19.8),
-        ]
-
         # Target temp is 20.0
         # Start temp is 22.0
         # Expected starting_delta = 20.0 - 22.0 = -2.0 (negative because cooling)
 
         # Record cycle
         recorder.record_cycle_metrics(
-            cycle_start_time=start_time,
+            cycle_start_time=CYCLE_START,
             cycle_target_temp=20.0,
             cycle_state_value="cooling",
-            temperature_history=temperature_history,
+            temperature_history=list(HIST_COOLING),
             outdoor_temp_history=[],
         )
 
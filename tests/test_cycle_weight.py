@@ -37,137 +37,72 @@ class TestCycleClassification:
         assert calc.is_recovery_cycle(0.25, is_stable=False) is False
 
 
-class TestCycleWeightCalculation:
-    """Test cycle weight calculation."""
-
-    def test_maintenance_cycle_base_weight(self):
-        """Maintenance cycle gets 0.3 base weight."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=0.2,
-            is_stable=False,
-            outcome=CycleOutcome.CLEAN,
-        )
-        assert weight == pytest.approx(0.3, rel=0.01)
+@pytest.fixture
+def convector_calc():
+    """Convector weight calculator (baseline thresholds)."""
+    return CycleWeightCalculator(HeatingType.CONVECTOR)
 
-    def test_recovery_cycle_base_weight(self):
-        """Recovery cycle gets 1.0 base weight."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=0.5,
-            is_stable=False,
-            outcome=CycleOutcome.CLEAN,
-        )
-        # base=1.0, delta_mult=1.0+(0.5-0.3)*0.5=1.1, outcome=1.0
-        assert weight == pytest.approx(1.1, rel=0.01)
 
-    def test_large_delta_increases_weight(self):
-        """Larger starting delta increases weight."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=2.0,
-            is_stable=False,
-            outcome=CycleOutcome.CLEAN,
-        )
-        # base=1.0, delta_mult=1.0+(2.0-0.3)*0.5=1.85, outcome=1.0
-        assert weight == pytest.approx(1.85, rel=0.01)
-
-    def test_delta_multiplier_capped_at_2(self):
-        """Delta multiplier caps at 2.0."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=5.0,  # Would give 1.0+(5.0-0.3)*0.5=3.35
-            is_stable=False,
-            outcome=CycleOutcome.CLEAN,
-        )
-        # Capped: base=1.0, delta_mult=2.0, outcome=1.0
-        assert weight == pytest.approx(2.0, rel=0.01)
-
-    def test_overshoot_reduces_weight(self):
-        """Overshoot outcome reduces weight by 0.7x."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=0.5,
-            is_stable=False,
-            outcome=CycleOutcome.OVERSHOOT,
-        )
-        # base=1.0, delta_mult=1.1, outcome=0.7 -> 1.0*1.1*0.7=0.77
-        assert weight == pytest.approx(0.77, rel=0.01)
+class TestCycleWeightCalculation:
+    """Test cycle weight calculation."""
 
-    def test_undershoot_reduces_weight_more(self):
-        """Undershoot outcome reduces weight by 0.5x."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=0.5,
+    @pytest.mark.parametrize(
+        "starting_delta, outcome, expected",
+        [
+            # Maintenance cycle gets 0.3 base weight
+            (0.2, CycleOutcome.CLEAN, 0.3),
+            # Recovery: base=1.0, delta_mult=1.0+(0.5-0.3)*0.5=1.1, outcome=1.0
+            (0.5, CycleOutcome.CLEAN, 1.1),
+            # Larger delta: base=1.0, delta_mult=1.0+(2.0-0.3)*0.5=1.85, outcome=1.0
+            (2.0, CycleOutcome.CLEAN, 1.85),
+            # Delta multiplier caps at 2.0 (uncapped would be 1.0+(5.0-0.3)*0.5=3.35)
+            (5.0, CycleOutcome.CLEAN, 2.0),
+            # Overshoot: 1.0*1.1*0.7=0.77
+            (0.5, CycleOutcome.OVERSHOOT, 0.77),
+            # Undershoot reduces more: 1.0*1.1*0.5=0.55
+            (0.5, CycleOutcome.UNDERSHOOT, 0.55),
+        ],
+        ids=["maintenance_base", "recovery_base", "large_delta", "delta_capped", "overshoot", "undershoot"],
+    )
+    def test_weight(self, convector_calc, starting_delta, outcome, expected):
+        """Weight is base * delta multiplier * outcome multiplier."""
+        weight = convector_calc.calculate_weight(
+            starting_delta=starting_delta,
             is_stable=False,
-            outcome=CycleOutcome.UNDERSHOOT,
+            outcome=outcome,
         )
-        # base=1.0, delta_mult=1.1, outcome=0.5 -> 1.0*1.1*0.5=0.55
-        assert weight == pytest.approx(0.55, rel=0.01)
+        assert weight == pytest.approx(expected, abs=1e-9)
 
 
 class TestBonuses:
     """Test bonus calculations."""
 
-    def test_duty_bonus_above_threshold(self):
-        """Effective duty >60% adds 0.15 bonus."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=0.5,
-            is_stable=False,
-            outcome=CycleOutcome.CLEAN,
-            effective_duty=0.65,
-        )
-        # base*delta*outcome + duty_bonus = 1.1 + 0.15 = 1.25
-        assert weight == pytest.approx(1.25, rel=0.01)
-
-    def test_no_duty_bonus_below_threshold(self):
-        """Effective duty <=60% adds no bonus."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=0.5,
-            is_stable=False,
-            outcome=CycleOutcome.CLEAN,
-            effective_duty=0.55,
-        )
-        assert weight == pytest.approx(1.1, rel=0.01)
-
-    def test_outdoor_bonus_below_threshold(self):
-        """Outdoor temp <5°C adds 0.15 bonus."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=0.5,
-            is_stable=False,
-            outcome=CycleOutcome.CLEAN,
-            outdoor_temp=3.0,
-        )
-        # 1.1 + 0.15 = 1.25
-        assert weight == pytest.approx(1.25, rel=0.01)
-
-    def test_night_setback_bonus(self):
-        """Night setback recovery adds 0.2 bonus."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=0.5,
-            is_stable=False,
-            outcome=CycleOutcome.CLEAN,
-            is_night_setback_recovery=True,
-        )
-        # 1.1 + 0.2 = 1.3
-        assert weight == pytest.approx(1.3, rel=0.01)
-
-    def test_all_bonuses_stack(self):
-        """All bonuses stack additively."""
-        calc = CycleWeightCalculator(HeatingType.CONVECTOR)
-        weight = calc.calculate_weight(
-            starting_delta=2.0,
+    @pytest.mark.parametrize(
+        "bonus_kwargs, starting_delta, expected",
+        [
+            # Effective duty >60% adds 0.15: 1.1 + 0.15
+            ({"effective_duty": 0.65}, 0.5, 1.25),
+            # Effective duty <=60% adds no bonus
+            ({"effective_duty": 0.55}, 0.5, 1.1),
+            # Outdoor temp <5°C adds 0.15: 1.1 + 0.15
+            ({"outdoor_temp": 3.0}, 0.5, 1.25),
+            # Night setback recovery adds 0.2: 1.1 + 0.2
+            ({"is_night_setback_recovery": True}, 0.5, 1.3),
+            # All bonuses stack additively: challenge 1.85 + (0.15 + 0.15 + 0.2)
+            (
+                {"effective_duty": 0.70, "outdoor_temp": 0.0, "is_night_setback_recovery": True},
+                2.0,
+                2.35,
+            ),
+        ],
+        ids=["duty_above_threshold", "duty_below_threshold", "cold_outdoor", "night_setback", "all_stack"],
+    )
+    def test_bonus(self, convector_calc, bonus_kwargs, starting_delta, expected):
+        """Bonuses are added on top of the clean-cycle challenge weight."""
+        weight = convector_calc.calculate_weight(
+            starting_delta=starting_delta,
             is_stable=False,
             outcome=CycleOutcome.CLEAN,
-            effective_duty=0.70,
-            outdoor_temp=0.0,
-            is_night_setback_recovery=True,
+            **bonus_kwargs,
         )
-        # base=1.0, delta_mult=1.85, outcome=1.0 -> challenge=1.85
-        # bonuses: 0.15 + 0.15 + 0.2 = 0.5
-        # total: 1.85 + 0.5 = 2.35
-        assert weight == pytest.approx(2.35, rel=0.01)
+        assert weight == pytest.approx(expected, abs=1e-9)
@@ -1,7 +1,9 @@
 """Tests for HeatingRateLearner."""
 
+import dataclasses
+
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from custom_components.adaptive_climate.adaptive.heating_rate_learner import (
     HeatingRateObservation,
@@ -11,6 +13,16 @@ from custom_components.adaptive_climate.adaptive.heating_rate_learner import (
 )
 from custom_components.adaptive_climate.const import HeatingType
 
+# Shared session timestamps (datetimes are immutable, so sharing them between tests is safe)
+_T10 = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+_T10_15 = _T10.replace(minute=15)
+_T10_45 = _T10.replace(minute=45)
+_T11 = _T10.replace(hour=11)
+_T12 = _T10.replace(hour=12)
+_T13 = _T10.replace(hour=13)
+# Two back-to-back one-hour sessions
+_START_END_PAIRS = ((_T10, _T11), (_T12, _T13))
+
 
 def test_heating_rate_observation_creation():
     """Test observation dataclass stores all fields."""
@@ -19,7 +31,7 @@ def test_heating_rate_observation_creation():
         duration_min=180.0,
         source="session",
         stalled=False,
-        timestamp=datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc),
+        timestamp=_T10,
     )
     assert obs.rate == 0.15
     assert obs.duration_min == 180.0
@@ -27,11 +39,24 @@ def test_heating_rate_observation_creation():
     assert obs.stalled is False
 
 
+def test_heating_rate_observation_is_immutable():
+    """Test banked observations cannot be mutated after creation."""
+    obs = HeatingRateObservation(
+        rate=0.15,
+        duration_min=180.0,
+        source="session",
+        stalled=False,
+        timestamp=_T10,
+    )
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        obs.rate = 0.3
+
+
 def test_recovery_session_creation():
     """Test session dataclass stores tracking state."""
     session = RecoverySession(
         start_temp=18.0,
-        start_time=datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc),
+        start_time=_T10,
         target_setpoint=21.0,
         outdoor_temp=5.0,
     )
@@ -42,33 +67,37 @@ def test_recovery_session_creation():
     assert session.last_progress_cycle == 0
 
 
-class TestBinning:
-    """Tests for observation binning."""
+@pytest.fixture
+def radiator_learner():
+    """Create a fresh radiator learner."""
+    return HeatingRateLearner(HeatingType.RADIATOR)
 
-    def test_get_bin_key_delta_0_2_cold(self):
-        """Test bin key for small delta, cold outdoor."""
-        learner = HeatingRateLearner(HeatingType.RADIATOR)
-        key = learner._get_bin_key(delta=1.5, outdoor_temp=3.0)
-        assert key == "delta_0_2_cold"
 
-    def test_get_bin_key_delta_4_6_mild(self):
-        """Test bin key for medium delta, mild outdoor."""
-        learner = HeatingRateLearner(HeatingType.RADIATOR)
-        key = learner._get_bin_key(delta=5.0, outdoor_temp=10.0)
-        assert key == "delta_4_6_mild"
+class TestBinning:
+    """Tests for observation binning."""
 
-    def test_get_bin_key_delta_6_plus_moderate(self):
-        """Test bin key for large delta, warm outdoor."""
-        learner = HeatingRateLearner(HeatingType.FLOOR_HYDRONIC)
-        key = learner._get_bin_key(delta=8.0, outdoor_temp=18.0)
-        assert key == "delta_6_plus_moderate"
+    @pytest.mark.parametrize(
+        "delta, outdoor_temp, expected",
+        [
+            (1.5, 3.0, "delta_0_2_cold"),
+            (5.0, 10.0, "delta_4_6_mild"),
+            (8.0, 18.0, "delta_6_plus_moderate"),
+            (0.0, -10.0, "delta_0_2_cold"),
+            (2.0, 5.0, "delta_2_4_mild"),  # lower edges are inclusive
+            (4.0, 15.0, "delta_4_6_moderate"),
+            (6.0, 4.9, "delta_6_plus_cold"),
+            (-0.5, 10.0, "delta_6_plus_mild"),  # negative delta defaults to largest bin
+        ],
+    )
+    def test_get_bin_key(self, radiator_learner, delta, outdoor_temp, expected):
+        """Test bin key for delta and outdoor temp; bin edges belong to the upper bin."""
+        assert radiator_learner._get_bin_key(delta=delta, outdoor_temp=outdoor_temp) == expected
 
-    def test_all_12_bins_exist(self):
+    def test_all_12_bins_exist(self, radiator_learner):
         """Test learner initializes all 12 bins."""
-        learner = HeatingRateLearner(HeatingType.RADIATOR)
-        assert len(learner._bins) == 12
-        assert "delta_0_2_cold" in learner._bins
-        assert "delta_6_plus_moderate" in learner._bins
+        assert len(radiator_learner._bins) == 12
+        assert "delta_0_2_cold" in radiator_learner._bins
+        assert "delta_6_plus_moderate" in radiator_learner._bins
 
 
 class TestAddObservation:
@@ -180,6 +209,35 @@ class TestGetHeatingRate:
         rate, source = learner.get_heating_rate(delta=3.0, outdoor_temp=8.0)
         assert source == "fallback"  # Only 2 observations, not enough
 
+    def test_rate_refreshes_after_new_observation(self):
+        """Test a queried bin reflects observations added after the query."""
+        learner = HeatingRateLearner(HeatingType.RADIATOR)
+        for rate in [0.4, 0.4, 0.4]:
+            learner.add_observation(
+                rate=rate, duration_min=60, source="session", stalled=False, delta=3.0, outdoor_temp=8.0
+            )
+        assert learner.get_heating_rate(delta=3.0, outdoor_temp=8.0) == (pytest.approx(0.4), "learned_session")
+
+        learner.add_observation(rate=0.8, duration_min=60, source="session", stalled=False, delta=3.0, outdoor_temp=8.0)
+
+        assert learner.get_heating_rate(delta=3.0, outdoor_temp=8.0) == (pytest.approx(0.5), "learned_session")
+
+    def test_rate_excludes_evicted_observations(self):
+        """Test observations pushed out of a full bin no longer count toward the rate."""
+        learner = HeatingRateLearner(HeatingType.RADIATOR)
+        for _ in range(20):
+            learner.add_observation(
+                rate=0.3, duration_min=30, source="cycle", stalled=False, delta=3.0, outdoor_temp=8.0
+            )
+        for _ in range(18):
+            learner.add_observation(
+                rate=0.6, duration_min=60, source="session", stalled=False, delta=3.0, outdoor_temp=8.0
+            )
+
+        # Only 2 cycle observations remain, all 18 sessions count
+        assert learner._get_mean_rate("delta_2_4_mild", "cycle") == (pytest.approx(0.3), 2)
+        assert learner.get_heating_rate(delta=3.0, outdoor_temp=8.0) == (pytest.approx(0.6), "learned_session")
+
 
 class TestSessionTracking:
     """Tests for recovery session tracking."""
@@ -187,7 +245,7 @@ class TestSessionTracking:
     def test_start_session_creates_active_session(self):
         """Test start_session creates tracking state."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        now = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        now = _T10
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=now)
 
@@ -199,8 +257,8 @@ class TestSessionTracking:
     def test_end_session_success_banks_observation(self):
         """Test successful session banks rate observation."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 10, 45, tzinfo=timezone.utc)  # 45 min
+        start = _T10
+        end = _T10_45  # 45 min
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
         obs = learner.end_session(end_temp=20.8, reason="reached_setpoint", timestamp=end)
@@ -215,8 +273,8 @@ class TestSessionTracking:
     def test_end_session_stalled_banks_observation(self):
         """Test stalled session banks observation with stalled=True."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)  # 60 min
+        start = _T10
+        end = _T11  # 60 min
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
         obs = learner.end_session(end_temp=19.5, reason="stalled", timestamp=end)
@@ -229,8 +287,8 @@ class TestSessionTracking:
     def test_end_session_too_short_discards(self):
         """Test session shorter than minimum is discarded."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 10, 15, tzinfo=timezone.utc)  # 15 min (radiator min is 30)
+        start = _T10
+        end = _T10_15  # 15 min (radiator min is 30)
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
         obs = learner.end_session(end_temp=19.0, reason="reached_setpoint", timestamp=end)
@@ -241,8 +299,8 @@ class TestSessionTracking:
     def test_end_session_override_discards(self):
         """Test session interrupted by override is discarded."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)
+        start = _T10
+        end = _T11
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
         obs = learner.end_session(end_temp=19.0, reason="override", timestamp=end)
@@ -264,7 +322,7 @@ class TestSessionUpdates:
     def test_update_session_tracks_progress(self):
         """Test update_session records cycle data."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        now = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        now = _T10
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=now)
         learner.update_session(temp=18.5, duty=0.75)
@@ -277,7 +335,7 @@ class TestSessionUpdates:
     def test_update_session_detects_no_progress(self):
         """Test stall detection when temp doesn't rise."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        now = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        now = _T10
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=now)
         learner.update_session(temp=18.05, duty=0.75)  # <0.1 rise = no progress
@@ -291,7 +349,7 @@ class TestSessionUpdates:
     def test_is_stalled_after_3_no_progress_cycles(self):
         """Test is_stalled returns True after 3 cycles without progress."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        now = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        now = _T10
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=now)
         assert learner.is_stalled() is False
@@ -308,7 +366,7 @@ class TestSessionUpdates:
     def test_progress_resets_stall_detection(self):
         """Test making progress resets the stall counter."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        now = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        now = _T10
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=now)
         learner.update_session(temp=18.05, duty=0.75)  # no progress
@@ -321,7 +379,7 @@ class TestSessionUpdates:
     def test_get_avg_session_duty(self):
         """Test calculating average duty for session."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        now = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        now = _T10
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=now)
         learner.update_session(temp=18.5, duty=0.70)
@@ -337,8 +395,8 @@ class TestStallCounter:
     def test_stall_increments_counter(self):
         """Test stalled session increments stall counter."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)
+        start = _T10
+        end = _T11
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
         learner.end_session(end_temp=19.0, reason="stalled", timestamp=end)
@@ -348,8 +406,8 @@ class TestStallCounter:
     def test_success_resets_counter(self):
         """Test successful session resets stall counter."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)
+        start = _T10
+        end = _T11
 
         # First session stalls
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
@@ -357,8 +415,8 @@ class TestStallCounter:
         assert learner._stall_counter == 1
 
         # Second session succeeds
-        start2 = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
-        end2 = datetime(2026, 1, 15, 13, 0, tzinfo=timezone.utc)
+        start2 = _T12
+        end2 = _T13
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start2)
         learner.end_session(end_temp=20.8, reason="reached_setpoint", timestamp=end2)
 
@@ -367,8 +425,8 @@ class TestStallCounter:
     def test_outdoor_change_resets_counter(self):
         """Test significant outdoor temp change resets stall counter."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)
+        start = _T10
+        end = _T11
 
         # First stall at outdoor=5
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
@@ -376,8 +434,8 @@ class TestStallCounter:
         assert learner._stall_counter == 1
 
         # Second stall at outdoor=-2 (>5 degree change)
-        start2 = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
-        end2 = datetime(2026, 1, 15, 13, 0, tzinfo=timezone.utc)
+        start2 = _T12
+        end2 = _T13
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=-2.0, timestamp=start2)
         learner.end_session(end_temp=19.0, reason="stalled", timestamp=end2)
 
@@ -387,16 +445,16 @@ class TestStallCounter:
     def test_setpoint_change_resets_counter(self):
         """Test significant setpoint change resets stall counter."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)
+        start = _T10
+        end = _T11
 
         # First stall at setpoint=21
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
         learner.end_session(end_temp=19.0, reason="stalled", timestamp=end)
 
         # Second stall at setpoint=23 (>1 degree change)
-        start2 = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
-        end2 = datetime(2026, 1, 15, 13, 0, tzinfo=timezone.utc)
+        start2 = _T12
+        end2 = _T13
         learner.start_session(temp=18.0, setpoint=23.0, outdoor_temp=5.0, timestamp=start2)
         learner.end_session(end_temp=19.0, reason="stalled", timestamp=end2)
 
@@ -406,9 +464,7 @@ class TestStallCounter:
         """Test Ki boost triggered after 2 consecutive stalls with headroom."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
 
-        for i in range(2):
-            start = datetime(2026, 1, 15, 10 + i * 2, 0, tzinfo=timezone.utc)
-            end = datetime(2026, 1, 15, 11 + i * 2, 0, tzinfo=timezone.utc)
+        for start, end in _START_END_PAIRS:
             learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
             learner.update_session(temp=18.5, duty=0.60)  # Low duty
             learner.end_session(end_temp=19.0, reason="stalled", timestamp=end)
@@ -419,9 +475,7 @@ class TestStallCounter:
         """Test no Ki boost when duty is high (capacity limited)."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
 
-        for i in range(2):
-            start = datetime(2026, 1, 15, 10 + i * 2, 0, tzinfo=timezone.utc)
-            end = datetime(2026, 1, 15, 11 + i * 2, 0, tzinfo=timezone.utc)
+        for start, end in _START_END_PAIRS:
             learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
             learner.update_session(temp=18.5, duty=0.90)  # High duty
             learner.end_session(end_temp=19.0, reason="stalled", timestamp=end)
@@ -432,9 +486,7 @@ class TestStallCounter:
         """Test acknowledging Ki boost resets the stall counter."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
 
-        for i in range(2):
-            start = datetime(2026, 1, 15, 10 + i * 2, 0, tzinfo=timezone.utc)
-            end = datetime(2026, 1, 15, 11 + i * 2, 0, tzinfo=timezone.utc)
+        for start, end in _START_END_PAIRS:
             learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
             learner.update_session(temp=18.5, duty=0.60)
             learner.end_session(end_temp=19.0, reason="stalled", timestamp=end)
@@ -530,10 +582,47 @@ class TestSerialization:
         assert restored.get_observation_count() == learner.get_observation_count()
         assert len(restored._bins["delta_2_4_mild"]) == 3
 
+    def test_from_dict_caps_oversized_bin(self):
+        """Test from_dict keeps only the newest MAX_OBSERVATIONS_PER_BIN observations."""
+        obs_list = [
+            {
+                "rate": 0.1 * (i + 1),
+                "duration_min": 60,
+                "source": "session",
+                "stalled": False,
+                "timestamp": "2026-01-15T10:00:00+00:00",
+            }
+            for i in range(25)
+        ]
+        restored = HeatingRateLearner.from_dict({"heating_type": "radiator", "bins": {"delta_2_4_mild": obs_list}})
+
+        bin_obs = restored._bins["delta_2_4_mild"]
+        assert len(bin_obs) == HeatingRateLearner.MAX_OBSERVATIONS_PER_BIN
+        assert bin_obs[0].rate == pytest.approx(0.6)
+        assert bin_obs[-1].rate == pytest.approx(2.5)
+
+    @pytest.mark.parametrize("source", [None, 1, "unknown"])
+    def test_from_dict_drops_unknown_source(self, source):
+        """Test from_dict skips observations whose persisted source is not "session" or "cycle"."""
+        obs_list = [
+            {
+                "rate": 0.5,
+                "duration_min": 60,
+                "source": obs_source,
+                "stalled": False,
+                "timestamp": "2026-01-15T10:00:00+00:00",
+            }
+            for obs_source in (source, "session")
+        ]
+        restored = HeatingRateLearner.from_dict({"heating_type": "radiator", "bins": {"delta_2_4_mild": obs_list}})
+
+        assert [obs.source for obs in restored._bins["delta_2_4_mild"]] == ["session"]
+        assert restored._get_mean_rate("delta_2_4_mild", source) == (None, 0)
+
     def test_observation_serialization(self):
         """Test observation round-trips correctly."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        ts = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        ts = _T10
 
         learner.add_observation(
             rate=0.5, duration_min=60, source="session", stalled=True, delta=3.0, outdoor_temp=8.0, timestamp=ts
@@ -551,8 +640,8 @@ class TestSerialization:
     def test_stall_counter_persists(self):
         """Test stall counter survives serialization."""
         learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)
+        start = _T10
+        end = _T11
 
         learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
         learner.end_session(end_temp=19.0, reason="stalled", timestamp=end)
@@ -568,90 +657,39 @@ class TestSerialization:
 class TestMinimumRateFilter:
     """Tests for minimum rate filtering."""
 
-    def test_negative_rate_rejected_by_end_session(self):
-        """Test end_session rejects negative rates (temp drop)."""
-        learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)  # 60 min
-
-        learner.start_session(temp=20.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
-        obs = learner.end_session(end_temp=19.5, reason="reached_setpoint", timestamp=end)
-
-        # Negative rate should be rejected
-        assert obs is None
-        assert learner.get_observation_count() == 0
-
-    def test_near_zero_rate_rejected_by_end_session(self):
-        """Test end_session rejects near-zero rates."""
-        learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)  # 60 min
-
-        # Rate = 0.01°C over 1h = 0.01°C/h (below 0.02 threshold)
-        learner.start_session(temp=20.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
-        obs = learner.end_session(end_temp=20.01, reason="reached_setpoint", timestamp=end)
-
-        assert obs is None
-        assert learner.get_observation_count() == 0
-
-    def test_low_but_valid_rate_accepted(self):
-        """Test end_session accepts low but valid rates above threshold."""
-        learner = HeatingRateLearner(HeatingType.RADIATOR)
-        start = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
-        end = datetime(2026, 1, 15, 11, 0, tzinfo=timezone.utc)  # 60 min
-
-        # Rate = 0.05°C over 1h = 0.05°C/h (above 0.02 threshold)
-        learner.start_session(temp=20.0, setpoint=21.0, outdoor_temp=5.0, timestamp=start)
-        obs = learner.end_session(end_temp=20.05, reason="reached_setpoint", timestamp=end)
-
-        assert obs is not None
-        assert obs.rate == pytest.approx(0.05)
-        assert learner.get_observation_count() == 1
-
-    def test_add_observation_rejects_bad_rate(self):
-        """Test add_observation rejects negative rates."""
-        learner = HeatingRateLearner(HeatingType.RADIATOR)
-
-        learner.add_observation(
-            rate=-0.1,
-            duration_min=60,
-            source="session",
-            stalled=False,
-            delta=3.0,
-            outdoor_temp=8.0,
-        )
-
-        assert learner.get_observation_count() == 0
-
-    def test_add_observation_rejects_near_zero_rate(self):
-        """Test add_observation rejects near-zero rates."""
-        learner = HeatingRateLearner(HeatingType.RADIATOR)
-
-        learner.add_observation(
-            rate=0.01,
-            duration_min=60,
-            source="session",
-            stalled=False,
-            delta=3.0,
-            outdoor_temp=8.0,
-        )
-
-        assert learner.get_observation_count() == 0
-
-    def test_add_observation_accepts_valid_rate(self):
-        """Test add_observation accepts valid rates."""
-        learner = HeatingRateLearner(HeatingType.RADIATOR)
-
-        learner.add_observation(
-            rate=0.05,
-            duration_min=60,
-            source="session",
-            stalled=False,
-            delta=3.0,
-            outdoor_temp=8.0,
+    @pytest.mark.parametrize(
+        "end_temp, accepted",
+        [
+            (19.5, False),  # negative rate (temp drop)
+            (20.01, False),  # 0.01°C/h, below 0.02 threshold
+            (20.05, True),  # 0.05°C/h, low but valid
+        ],
+        ids=["negative", "near_zero", "low_but_valid"],
+    )
+    def test_end_session_rate_filter(self, radiator_learner, end_temp, accepted):
+        """Test end_session only banks sessions at or above the minimum rate."""
+        radiator_learner.start_session(temp=20.0, setpoint=21.0, outdoor_temp=5.0, timestamp=_T10)
+        obs = radiator_learner.end_session(end_temp=end_temp, reason="reached_setpoint", timestamp=_T11)  # 60 min
+
+        if accepted:
+            assert obs is not None
+            assert obs.rate == pytest.approx(end_temp - 20.0)
+        else:
+            assert obs is None
+        assert radiator_learner.get_observation_count() == int(accepted)
+
+    @pytest.mark.parametrize(
+        "rate, expected_count",
+        [(-0.1, 0), (0.01, 0), (0.05, 1)],
+        ids=["negative", "near_zero", "valid"],
+    )
+    def test_add_observation_rate_filter(self, radiator_learner, rate, expected_count):
+        """Test add_observation rejects negative and near-zero rates."""
+        radiator_learner.add_observation(
+            rate=rate, duration_min=60, source="session", stalled=False, delta=3.0, outdoor_temp=8.0
         )
 
-        assert learner.get_observation_count() == 1
+        assert radiator_learner.get_observation_count() == expected_count
 
 
 class TestPhysicsComparison:
@@ -667,12 +705,12 @@ class TestPhysicsComparison:
     def test_sufficient_observations_returns_comparison(self):
         """Test returns comparison dict with enough observations."""
         learner = HeatingRateLearner(HeatingType.FLOOR_HYDRONIC)
-        base_time = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        base_time = _T10
 
         # Add 3 session observations (minimum required)
         for i in range(3):
-            start = base_time.replace(hour=10 + i * 3)
-            end = start.replace(hour=start.hour + 2)
+            start = base_time + timedelta(hours=i * 3)
+            end = start + timedelta(hours=2)
             learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=3.0, timestamp=start)
             learner.end_session(end_temp=20.5, reason="reached_target", timestamp=end)
 
@@ -688,12 +726,12 @@ class TestPhysicsComparison:
     def test_underperforming_detection(self):
         """Test detects underperforming when rate is below 50% of expected."""
         learner = HeatingRateLearner(HeatingType.FLOOR_HYDRONIC)
-        base_time = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        base_time = _T10.replace(hour=6)
 
         # Add sessions with very low rate (~0.1°C/h, well below expected 0.3°C/h baseline)
         for i in range(3):
-            start = base_time.replace(day=15 + i, hour=6)
-            end = start.replace(hour=16)  # 10 hours for 1°C rise = 0.1°C/h
+            start = base_time + timedelta(days=i)
+            end = start + timedelta(hours=10)  # 10 hours for 1°C rise = 0.1°C/h
             learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=3.0, timestamp=start)
             learner.end_session(end_temp=19.0, reason="reached_target", timestamp=end)
 
@@ -707,12 +745,12 @@ class TestPhysicsComparison:
     def test_performing_well_no_boost_suggested(self):
         """Test no boost suggested when rate is adequate."""
         learner = HeatingRateLearner(HeatingType.FLOOR_HYDRONIC)
-        base_time = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        base_time = _T10.replace(hour=6)
 
         # Add sessions with good rate (~0.5°C/h, above expected 0.3°C/h baseline)
         for i in range(3):
-            start = base_time.replace(day=15 + i, hour=6)
-            end = start.replace(hour=12)  # 6 hours for 3°C rise = 0.5°C/h
+            start = base_time + timedelta(days=i)
+            end = start + timedelta(hours=6)  # 6 hours for 3°C rise = 0.5°C/h
             learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=3.0, timestamp=start)
             learner.end_session(end_temp=21.0, reason="reached_target", timestamp=end)
 
@@ -724,12 +762,12 @@ class TestPhysicsComparison:
     def test_tau_scaling_affects_expected_rate(self):
         """Test that higher tau lowers expected rate."""
         learner = HeatingRateLearner(HeatingType.FLOOR_HYDRONIC)
-        base_time = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+        base_time = _T10.replace(hour=6)
 
         # Add sessions
         for i in range(3):
-            start = base_time.replace(day=15 + i, hour=6)
-            end = start.replace(hour=11)  # 5 hours for 1°C rise = 0.2°C/h
+            start = base_time + timedelta(days=i)
+            end = start + timedelta(hours=5)  # 5 hours for 1°C rise = 0.2°C/h
             learner.start_session(temp=18.0, setpoint=21.0, outdoor_temp=3.0, timestamp=start)
             learner.end_session(end_temp=19.0, reason="reached_target", timestamp=end)
 
@@ -21,10 +21,17 @@ from custom_components.adaptive_climate.adaptive.cycle_analysis import CycleMetr
 from custom_components.adaptive_climate.const import HeatingType
 
 
+@pytest.fixture
+def radiator_thermostat(make_thermostat, time_travel):
+    """Radiator thermostat built after the clock is frozen by time_travel."""
+    return make_thermostat(heating_type=HeatingType.RADIATOR)
+
+
 class TestFullPIDFeedbackLoop:
     """Test A1: Full PID feedback loop with real components."""
 
-    def test_multi_cycle_heating_scenario(self, make_thermostat, time_travel):
+    @pytest.mark.asyncio
+    async def test_multi_cycle_heating_scenario(self, radiator_thermostat, time_travel):
         """Simulate a multi-cycle heating scenario with PID, cycle tracking, and learning.
 
         This test demonstrates the complete feedback loop:
@@ -35,8 +42,7 @@ class TestFullPIDFeedbackLoop:
         5. Cycle completes and metrics are calculated
         6. Learner records the cycle observation
         """
-        # Create a thermostat with default radiator heating type
-        t = make_thermostat(heating_type=HeatingType.RADIATOR)
+        t = radiator_thermostat
 
         # Initial state: Room at 19.0°C, target 21.0°C
         t.current_temp = 19.0
@@ -111,9 +117,7 @@ class TestFullPIDFeedbackLoop:
             t.current_temp = temp
 
             # Update cycle tracker with temperature sample
-            import asyncio
-
-            asyncio.run(t.cycle_tracker.update_temperature(time_travel.now(), temp))
+            await t.cycle_tracker.update_temperature(time_travel.now(), temp)
 
             # Calculate PID output - should decrease as we approach target
             output, calculated = t.pid.calc(
@@ -145,7 +149,7 @@ class TestFullPIDFeedbackLoop:
         for temp in settling_temps:
             time_travel.advance(seconds=30)
             t.current_temp = temp
-            asyncio.run(t.cycle_tracker.update_temperature(time_travel.now(), temp))
+            await t.cycle_tracker.update_temperature(time_travel.now(), temp)
 
         # 6. Wait for settling to complete (cycle tracker should detect stability)
         # At this point, the cycle should be finalized and metrics recorded
@@ -169,7 +173,8 @@ class TestFullPIDFeedbackLoop:
 class TestSetpointChangeResponse:
     """Test A3: Setpoint change response with integral boost/decay."""
 
-    def test_setpoint_increase_applies_boost(self, make_thermostat, time_travel, mock_hass):
+    @pytest.mark.asyncio
+    async def test_setpoint_increase_applies_boost(self, radiator_thermostat, time_travel, mock_hass):
         """Test that setpoint increase triggers integral boost.
 
         Scenario:
@@ -181,7 +186,7 @@ class TestSetpointChangeResponse:
         from custom_components.adaptive_climate.managers.setpoint_boost import SetpointBoostManager
 
         # Create thermostat
-        t = make_thermostat(heating_type=HeatingType.RADIATOR)
+        t = radiator_thermostat
 
         # Set up initial state with some accumulated integral
         t.current_temp = 20.0
@@ -209,13 +214,11 @@ class TestSetpointChangeResponse:
         boost_manager.on_setpoint_change(old_setpoint, new_setpoint)
 
         # Advance time past debounce window to trigger boost
-        import asyncio
-
         time_travel.advance(seconds=6)
         # Execute pending callbacks manually since we're not in real async context
         # The boost_manager schedules a callback, we need to trigger it manually
         # For this test, we'll call _apply_boost directly
-        asyncio.run(boost_manager._apply_boost(time_travel.now()))
+        await boost_manager._apply_boost(time_travel.now())
 
         # Verify integral increased
         final_integral = t.pid.integral
@@ -223,7 +226,8 @@ class TestSetpointChangeResponse:
             f"Integral should increase after setpoint boost (was {initial_integral}, now {final_integral})"
         )
 
-    def test_setpoint_decrease_applies_decay(self, make_thermostat, time_travel, mock_hass):
+    @pytest.mark.asyncio
+    async def test_setpoint_decrease_applies_decay(self, radiator_thermostat, time_travel, mock_hass):
         """Test that setpoint decrease triggers integral decay.
 
         Scenario:
@@ -235,7 +239,7 @@ class TestSetpointChangeResponse:
         from custom_components.adaptive_climate.managers.setpoint_boost import SetpointBoostManager
 
         # Create thermostat
-        t = make_thermostat(heating_type=HeatingType.RADIATOR)
+        t = radiator_thermostat
 
         # Set up initial state with substantial accumulated integral
         t.current_temp = 20.0
@@ -263,10 +267,8 @@ class TestSetpointChangeResponse:
         boost_manager.on_setpoint_change(old_setpoint, new_setpoint)
 
         # Advance time past debounce window to trigger decay
-        import asyncio
-
         time_travel.advance(seconds=6)
-        asyncio.run(boost_manager._apply_boost(time_travel.now()))
+        await boost_manager._apply_boost(time_travel.now())
 
         # Verify integral decreased
         final_integral = t.pid.integral
@@ -283,7 +285,8 @@ class TestCycleMetricsPropagation:
     metrics flow correctly through the system.
     """
 
-    def test_cycle_metrics_basic_propagation(self, make_thermostat, time_travel):
+    @pytest.mark.asyncio
+    async def test_cycle_metrics_basic_propagation(self, radiator_thermostat, time_travel):
         """Test that basic cycle metrics are calculated and recorded.
 
         This verifies:
@@ -291,7 +294,6 @@ class TestCycleMetricsPropagation:
         2. Metrics recorder calculates overshoot, rise time, etc.
         3. Metrics are passed to learner
         """
-        import asyncio
         from custom_components.adaptive_climate.managers.events import (
             CycleStartedEvent,
             SettlingStartedEvent,
@@ -300,7 +302,7 @@ class TestCycleMetricsPropagation:
         )
 
         # Create thermostat
-        t = make_thermostat(heating_type=HeatingType.RADIATOR)
+        t = radiator_thermostat
 
         # Set initial conditions
         t.current_temp = 19.0
@@ -345,7 +347,7 @@ class TestCycleMetricsPropagation:
             if minute_offset > 0:
                 time_travel.advance(minutes=2)
             t.current_temp = temp
-            asyncio.run(t.cycle_tracker.update_temperature(time_travel.now(), temp))
+            await t.cycle_tracker.update_temperature(time_travel.now(), temp)
 
         # Stop heating
         time_travel.advance(minutes=2)
@@ -368,7 +370,7 @@ class TestCycleMetricsPropagation:
         settling_temps = [21.0] * 10
         for temp in settling_temps:
             time_travel.advance(seconds=30)
-            asyncio.run(t.cycle_tracker.update_temperature(time_travel.now(), temp))
+            await t.cycle_tracker.update_temperature(time_travel.now(), temp)
 
         # Verify cycle was recorded
         final_count = t.learner.get_cycle_count()
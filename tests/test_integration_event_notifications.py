@@ -1,6 +1,6 @@
 """Integration tests for event-driven notifications."""
 
-from unittest.mock import AsyncMock, MagicMock
+from itertools import repeat
 import pytest
 
 from custom_components.adaptive_climate.managers.notification_manager import (
@@ -14,26 +14,49 @@ from custom_components.adaptive_climate.managers.comfort_degradation import (
 )
 
 
+class _StubServices:
+    """Service registry that records calls instead of dispatching them."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, dict]] = []
+
+    def has_service(self, *_) -> bool:
+        return True
+
+    async def async_call(self, domain: str, service: str, data: dict, **kwargs) -> None:
+        self.calls.append((domain, service, data))
+
+
+class _StubHass:
+    """Minimal hass exposing only the services NotificationManager uses."""
+
+    def __init__(self) -> None:
+        self.services = _StubServices()
+
+
 @pytest.fixture
-def mock_hass():
-    hass = MagicMock()
-    hass.services = MagicMock()
-    hass.services.has_service = MagicMock(return_value=True)
-    hass.services.async_call = AsyncMock()
-    return hass
+def stub_hass():
+    return _StubHass()
+
+
+def _primed_detector(score: float, zone_id: str = "office", zone_name: str = "Office", samples: int = 50):
+    """Return a detector whose rolling window is pre-filled with one score."""
+    detector = ComfortDegradationDetector(zone_id=zone_id, zone_name=zone_name)
+    detector.record_scores(repeat(score, samples))
+    return detector
 
 
 @pytest.fixture
-def notification_manager(mock_hass):
+def notification_manager(stub_hass):
     return NotificationManager(
-        hass=mock_hass,
+        hass=stub_hass,
         notify_service="mobile_app_phone",
         persistent_notification=True,
     )
 
 
 @pytest.mark.asyncio
-async def test_learning_milestone_fires_notification(notification_manager, mock_hass):
+async def test_learning_milestone_fires_notification(notification_manager, stub_hass):
     """Learning tier change triggers notification through full stack."""
     tracker = LearningMilestoneTracker(
         zone_id="living_room",
@@ -43,33 +66,27 @@ async def test_learning_milestone_fires_notification(notification_manager, mock_
 
     # Initialize with collecting
     await tracker.async_check_milestone("collecting", 25)
-    mock_hass.services.async_call.reset_mock()
+    stub_hass.services.calls.clear()
 
     # Upgrade to stable
     result = await tracker.async_check_milestone("stable", 40)
     assert result is True
-    assert mock_hass.services.async_call.call_count == 2  # iOS + persistent
+    assert len(stub_hass.services.calls) == 2  # iOS + persistent
 
     # Verify notification content
-    ios_call = mock_hass.services.async_call.call_args_list[0]
-    assert "Living Room" in ios_call[0][2]["message"]
-    assert "stable" in ios_call[0][2]["message"]
+    ios_call = stub_hass.services.calls[0]
+    assert "Living Room" in ios_call[2]["message"]
+    assert "stable" in ios_call[2]["message"]
 
-    persistent_call = mock_hass.services.async_call.call_args_list[1]
-    assert "convergence" in persistent_call[0][2]["message"].lower()
+    persistent_call = stub_hass.services.calls[1]
+    assert "convergence" in persistent_call[2]["message"].lower()
 
 
 @pytest.mark.asyncio
-async def test_comfort_drop_fires_notification(notification_manager, mock_hass):
+async def test_comfort_drop_fires_notification(notification_manager, stub_hass):
     """Comfort degradation triggers notification through full stack."""
-    detector = ComfortDegradationDetector(
-        zone_id="office",
-        zone_name="Office",
-    )
-
     # Build up 24h average at ~82
-    for _ in range(50):
-        detector.record_score(82.0)
+    detector = _primed_detector(82.0)
 
     # Drop to 60
     triggered = detector.check_degradation(60.0)
@@ -92,17 +109,13 @@ async def test_comfort_drop_fires_notification(notification_manager, mock_hass):
 
 
 @pytest.mark.asyncio
-async def test_comfort_and_learning_independent(notification_manager, mock_hass):
+async def test_comfort_and_learning_independent(notification_manager, stub_hass):
     """Both notification types can fire for same zone without interfering."""
     tracker = LearningMilestoneTracker(
         zone_id="office",
         zone_name="Office",
         notification_manager=notification_manager,
     )
-    detector = ComfortDegradationDetector(
-        zone_id="office",
-        zone_name="Office",
-    )
 
     # Learning milestone
     await tracker.async_check_milestone("collecting", 20)
@@ -110,8 +123,7 @@ async def test_comfort_and_learning_independent(notification_manager, mock_hass)
     assert result1 is True
 
     # Comfort degradation (different notification_id)
-    for _ in range(50):
-        detector.record_score(85.0)
+    detector = _primed_detector(85.0)
     triggered = detector.check_degradation(60.0)
     assert triggered is True
 
@@ -124,11 +136,11 @@ async def test_comfort_and_learning_independent(notification_manager, mock_hass)
     assert result2 is True
 
     # Both sent (2 calls from milestone, 2 from comfort = 4)
-    assert mock_hass.services.async_call.call_count == 4
+    assert len(stub_hass.services.calls) == 4
 
 
 @pytest.mark.asyncio
-async def test_cooldown_across_events(notification_manager, mock_hass):
+async def test_cooldown_across_events(notification_manager, stub_hass):
     """Comfort alert cooldown doesn't affect learning milestone."""
     # Send comfort alert with cooldown
     await notification_manager.async_send(
@@ -157,7 +169,7 @@ async def test_cooldown_across_events(notification_manager, mock_hass):
 
 
 @pytest.mark.asyncio
-async def test_learning_milestone_upgrade_path(notification_manager, mock_hass):
+async def test_learning_milestone_upgrade_path(notification_manager, stub_hass):
     """Learning status progresses through tiers and fires notifications."""
     tracker = LearningMilestoneTracker(
         zone_id="bedroom",
@@ -165,31 +177,22 @@ async def test_learning_milestone_upgrade_path(notification_manager, mock_hass):
         notification_manager=notification_manager,
     )
 
-    # Start at collecting
-    result = await tracker.async_check_milestone("collecting", 15)
-    assert result is False  # No notification on first check
-    mock_hass.services.async_call.reset_mock()
-
-    # Upgrade to stable
-    result = await tracker.async_check_milestone("stable", 40)
-    assert result is True
-    assert mock_hass.services.async_call.call_count == 2
-    mock_hass.services.async_call.reset_mock()
-
-    # Upgrade to tuned
-    result = await tracker.async_check_milestone("tuned", 65)
-    assert result is True
-    assert mock_hass.services.async_call.call_count == 2
-    mock_hass.services.async_call.reset_mock()
-
-    # Upgrade to optimized
-    result = await tracker.async_check_milestone("optimized", 95)
-    assert result is True
-    assert mock_hass.services.async_call.call_count == 2
+    # (status, confidence, notified, service_calls); first check only records the tier
+    steps = [
+        ("collecting", 15, False, 0),
+        ("stable", 40, True, 2),  # iOS + persistent
+        ("tuned", 65, True, 2),
+        ("optimized", 95, True, 2),
+    ]
+    calls = stub_hass.services.calls
+    for status, confidence, notified, service_calls in steps:
+        calls.clear()
+        assert await tracker.async_check_milestone(status, confidence) is notified, status
+        assert len(calls) == service_calls, status
 
 
 @pytest.mark.asyncio
-async def test_learning_milestone_downgrade(notification_manager, mock_hass):
+async def test_learning_milestone_downgrade(notification_manager, stub_hass):
     """Learning status downgrade also triggers notification."""
     tracker = LearningMilestoneTracker(
         zone_id="kitchen",
@@ -199,21 +202,21 @@ async def test_learning_milestone_downgrade(notification_manager, mock_hass):
 
     # Start at tuned
     await tracker.async_check_milestone("tuned", 65)
-    mock_hass.services.async_call.reset_mock()
+    stub_hass.services.calls.clear()
 
     # Downgrade to collecting (e.g., after rollback)
     result = await tracker.async_check_milestone("collecting", 20)
     assert result is True
-    assert mock_hass.services.async_call.call_count == 2
+    assert len(stub_hass.services.calls) == 2
 
     # Verify message contains "dropped to"
-    ios_call = mock_hass.services.async_call.call_args_list[0]
-    assert "dropped to" in ios_call[0][2]["message"]
-    assert "collecting" in ios_call[0][2]["message"]
+    ios_call = stub_hass.services.calls[0]
+    assert "dropped to" in ios_call[2]["message"]
+    assert "collecting" in ios_call[2]["message"]
 
 
 @pytest.mark.asyncio
-async def test_learning_milestone_no_notification_for_idle(notification_manager, mock_hass):
+async def test_learning_milestone_no_notification_for_idle(notification_manager, stub_hass):
     """Idle transitions don't trigger notifications."""
     tracker = LearningMilestoneTracker(
         zone_id="bathroom",
@@ -221,32 +224,18 @@ async def test_learning_milestone_no_notification_for_idle(notification_manager,
         notification_manager=notification_manager,
     )
 
-    # Start at collecting
-    await tracker.async_check_milestone("collecting", 25)
-    mock_hass.services.async_call.reset_mock()
-
-    # Transition to idle
-    result = await tracker.async_check_milestone("idle", 0)
-    assert result is False
-    assert mock_hass.services.async_call.call_count == 0
-
-    # Transition from idle to collecting
-    result = await tracker.async_check_milestone("collecting", 10)
-    assert result is False
-    assert mock_hass.services.async_call.call_count == 0
+    # Start at collecting, drop to idle, then resume collecting
+    calls = stub_hass.services.calls
+    for status, confidence in [("collecting", 25), ("idle", 0), ("collecting", 10)]:
+        assert await tracker.async_check_milestone(status, confidence) is False, status
+        assert not calls, status
 
 
 @pytest.mark.asyncio
-async def test_comfort_degradation_absolute_threshold(notification_manager, mock_hass):
+async def test_comfort_degradation_absolute_threshold(notification_manager, stub_hass):
     """Comfort detector triggers on absolute threshold regardless of average."""
-    detector = ComfortDegradationDetector(
-        zone_id="living_room",
-        zone_name="Living Room",
-    )
-
     # Build up average at 75
-    for _ in range(50):
-        detector.record_score(75.0)
+    detector = _primed_detector(75.0, zone_id="living_room", zone_name="Living Room")
 
     # Drop to 64 (< 65 threshold)
     triggered = detector.check_degradation(64.0)
@@ -254,53 +243,31 @@ async def test_comfort_degradation_absolute_threshold(notification_manager, mock
 
 
 @pytest.mark.asyncio
-async def test_comfort_degradation_relative_drop(notification_manager, mock_hass):
+async def test_comfort_degradation_relative_drop(notification_manager, stub_hass):
     """Comfort detector triggers on significant drop from rolling average."""
-    detector = ComfortDegradationDetector(
-        zone_id="office",
-        zone_name="Office",
-    )
-
     # Build up average at 85
-    for _ in range(50):
-        detector.record_score(85.0)
+    detector = _primed_detector(85.0)
 
     # Drop to 69 (85 - 16 = 69, exceeds 15 point threshold)
     triggered = detector.check_degradation(69.0)
     assert triggered is True
 
     # 70 should trigger (85 - 70 = 15, at threshold, >= comparison)
-    detector2 = ComfortDegradationDetector(
-        zone_id="office2",
-        zone_name="Office 2",
-    )
-    for _ in range(50):
-        detector2.record_score(85.0)
+    detector2 = _primed_detector(85.0, zone_id="office2", zone_name="Office 2")
     triggered2 = detector2.check_degradation(70.0)
     assert triggered2 is True
 
     # 71 should not trigger (85 - 71 = 14, below threshold)
-    detector3 = ComfortDegradationDetector(
-        zone_id="office3",
-        zone_name="Office 3",
-    )
-    for _ in range(50):
-        detector3.record_score(85.0)
+    detector3 = _primed_detector(85.0, zone_id="office3", zone_name="Office 3")
     triggered3 = detector3.check_degradation(71.0)
     assert triggered3 is False
 
 
 @pytest.mark.asyncio
-async def test_comfort_degradation_insufficient_data(notification_manager, mock_hass):
+async def test_comfort_degradation_insufficient_data(notification_manager, stub_hass):
     """Comfort detector doesn't trigger with insufficient data."""
-    detector = ComfortDegradationDetector(
-        zone_id="bedroom",
-        zone_name="Bedroom",
-    )
-
     # Only 5 samples (need 12)
-    for _ in range(5):
-        detector.record_score(85.0)
+    detector = _primed_detector(85.0, zone_id="bedroom", zone_name="Bedroom", samples=5)
 
     # Even a big drop shouldn't trigger
     triggered = detector.check_degradation(50.0)
@@ -311,7 +278,7 @@ async def test_comfort_degradation_insufficient_data(notification_manager, mock_
 
 
 @pytest.mark.asyncio
-async def test_comfort_degradation_context_building(notification_manager, mock_hass):
+async def test_comfort_degradation_context_building(notification_manager, stub_hass):
     """Comfort detector builds useful context strings."""
     detector = ComfortDegradationDetector(
         zone_id="kitchen",
@@ -340,7 +307,7 @@ async def test_comfort_degradation_context_building(notification_manager, mock_h
 
 
 @pytest.mark.asyncio
-async def test_notification_manager_fallback_message(notification_manager, mock_hass):
+async def test_notification_manager_fallback_message(notification_manager, stub_hass):
     """Persistent notification falls back to iOS message if not provided."""
     result = await notification_manager.async_send(
         notification_id="test_notification",
@@ -350,15 +317,15 @@ async def test_notification_manager_fallback_message(notification_manager, mock_
     assert result is True
 
     # Both calls should use the same message
-    ios_call = mock_hass.services.async_call.call_args_list[0]
-    persistent_call = mock_hass.services.async_call.call_args_list[1]
+    ios_call = stub_hass.services.calls[0]
+    persistent_call = stub_hass.services.calls[1]
 
-    assert ios_call[0][2]["message"] == "Short message"
-    assert persistent_call[0][2]["message"] == "Short message"
+    assert ios_call[2]["message"] == "Short message"
+    assert persistent_call[2]["message"] == "Short message"
 
 
 @pytest.mark.asyncio
-async def test_notification_manager_separate_messages(notification_manager, mock_hass):
+async def test_notification_manager_separate_messages(notification_manager, stub_hass):
     """Persistent notification can have different message than iOS."""
     result = await notification_manager.async_send(
         notification_id="test_notification",
@@ -368,8 +335,8 @@ async def test_notification_manager_separate_messages(notification_manager, mock
     )
     assert result is True
 
-    ios_call = mock_hass.services.async_call.call_args_list[0]
-    persistent_call = mock_hass.services.async_call.call_args_list[1]
+    ios_call = stub_hass.services.calls[0]
+    persistent_call = stub_hass.services.calls[1]
 
-    assert ios_call[0][2]["message"] == "Short"
-    assert persistent_call[0][2]["message"] == "Long detailed message with markdown"
+    assert ios_call[2]["message"] == "Short"
+    assert persistent_call[2]["message"] == "Long detailed message with markdown"